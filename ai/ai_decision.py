@@ -16,6 +16,7 @@ from ai.deepseek_client import get_deepseek_client
 from ai.specialized_prompts import get_specialized_prompt, get_asset_description
 from strategy.indicators import QuantMetrics
 from strategy.asset_config import infer_asset_class
+from strategy.etf_strategy import Decision
 from data.fund_valuation import FundValuation
 from data.holdings import HoldingsInsight
 from data.market import MarketContext
@@ -28,11 +29,12 @@ logger = get_logger("ai_decision")
 @dataclass
 class AIDecisionResult:
     """AI主导决策结果"""
-    decision: str               # 决策: 双倍补仓/正常定投/暂停定投/观望
+    decision: str               # 决策: 双倍补仓/正常定投/暂停定投/观望（仅用于展示）
     confidence: str             # 信心度: 高/中/低
     reasoning: str              # 决策理由
     asset_class: str            # 资产类型
     raw_response: Optional[str] = None  # 原始 AI 回复
+    decision_enum: Optional[Decision] = None  # 决策枚举（合成器优先使用，避免重复解析字符串）
 
 
 def _build_ai_context(
@@ -382,7 +384,8 @@ def get_ai_decision(
             confidence=confidence,
             reasoning=reasoning,
             asset_class=asset_class,
-            raw_response=response
+            raw_response=response,
+            decision_enum=Decision(decision)
         )
         
     except Exception as e:
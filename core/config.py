@@ -50,6 +50,12 @@ class SchedulerConfig:
     decision_time: str = "14:45"
 
 
+@dataclass
+class ChartConfig:
+    """图表配置"""
+    fast_chart: bool = False  # 趋势图使用 Pillow 直接绘制（不经过 matplotlib）
+
+
 @dataclass
 class AppConfig:
     """应用总配置"""
@@ -57,6 +63,7 @@ class AppConfig:
     email: EmailConfig
     scheduler: SchedulerConfig
     funds: list[FundConfig] = field(default_factory=list)
+    chart: ChartConfig = field(default_factory=ChartConfig)
 
 
 def _parse_fund_list(fund_list_str: str) -> list[FundConfig]:
@@ -115,11 +122,17 @@ def load_config() -> AppConfig:
     # 基金列表
     funds = _parse_fund_list(os.getenv("FUND_LIST", "[]"))
     
+    # 图表配置
+    chart = ChartConfig(
+        fast_chart=os.getenv("FUND_PILOT_FAST_CHART", "false").lower() == "true"
+    )
+    
     return AppConfig(
         deepseek=deepseek,
         email=email,
         scheduler=scheduler,
-        funds=funds
+        funds=funds,
+        chart=chart
     )
 
 
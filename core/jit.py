@@ -0,0 +1,23 @@
+"""
+FundPilot-AI JIT 编译支持
+安装 numba 时使用 @njit 编译数值内核，未安装时退化为普通 Python 函数
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """
+        numba.njit 的空实现，原样返回被装饰函数
+        
+        支持 @njit 与 @njit(cache=True, ...) 两种写法
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        return decorator
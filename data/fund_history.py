@@ -8,6 +8,7 @@ from datetime import date
 from typing import Optional
 
 import akshare as ak
+import numpy as np
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from core.logger import get_logger
@@ -22,6 +23,9 @@ DEFAULT_DAYS = 260
 # AkShare 请求间隔（秒）
 AKSHARE_REQUEST_INTERVAL = 1.0
 
+# 净值数组存储类型：必须为 float64，float32 会改变分位值，使处于阈值边界的基金落入相邻区间
+NAV_DTYPE = np.float64
+
 
 @retry(
     stop=stop_after_attempt(3),
@@ -148,6 +152,19 @@ def calculate_nav_stats(nav_history: list[tuple[date, float]]) -> dict:
     }
 
 
+def nav_array(nav_history: list[tuple[date, float]]) -> np.ndarray:
+    """
+    提取净值序列为紧凑数组（供指标计算使用）
+    
+    Args:
+        nav_history: [(日期, 净值), ...] 按日期降序（最新在前）
+    
+    Returns:
+        净值数组 (NAV_DTYPE)，顺序与输入一致
+    """
+    return np.fromiter((nav for _, nav in nav_history), dtype=NAV_DTYPE, count=len(nav_history))
+
+
 def get_recent_nav(nav_history: list[tuple[date, float]], count: int = 10) -> list[tuple[date, float]]:
     """获取最近 N 天净值（用于图表）"""
     return nav_history[:count]
@@ -11,7 +11,7 @@ from core.config import get_config, FundConfig
 from core.logger import get_logger
 from core.database import get_database
 from data.fund_valuation import fetch_fund_valuation, FundValuation
-from data.fund_history import get_fund_history, get_recent_nav
+from data.fund_history import get_fund_history, get_recent_nav, nav_array
 from data.holdings import get_holdings_with_quotes
 from data.market import get_market_context
 from data.http_client import request_stats
@@ -74,7 +74,7 @@ def process_single_fund(fund: FundConfig, time_str: str) -> FundResult:
             return FundResult(fund=fund, success=False, error="获取历史净值失败")
         
         # 3. 计算量化指标（多周期分位值 + 波动率）
-        prices_history = [nav for _, nav in history]
+        prices_history = nav_array(history)
         metrics = calculate_all_metrics(
             current_price=valuation.estimate_nav,
             prices_history=prices_history,
@@ -161,7 +161,7 @@ def process_single_fund(fund: FundConfig, time_str: str) -> FundResult:
             estimate_change=valuation.estimate_change,
             percentile_250=metrics.percentile_250,
             ma_deviation=metrics.ma_deviation,
-            zone=strategy_result.zone,
+            zone=strategy_result.zone.label,
             holdings_summary=holdings.summary if holdings else None,
             top_gainers=holdings.top_gainers if holdings else None,
             top_losers=holdings.top_losers if holdings else None,
@@ -338,7 +338,7 @@ def run_alert_task():
                 logger.warning(f"预警: {fund.name} 历史数据获取失败")
                 continue
             
-            prices_history = [nav for _, nav in history]
+            prices_history = nav_array(history)
             metrics = calculate_all_metrics(
                 current_price=valuation.estimate_nav,
                 prices_history=prices_history,
@@ -0,0 +1,29 @@
+"""
+FundPilot-AI 指标数值内核 AOT 编译脚本
+使用 numba.pycc 将 strategy.indicators 的数值内核预编译为扩展模块 strategy/indicators_native，
+避免首次调用时的 JIT 编译延迟
+
+用法（需安装 numba 与 C 编译器，部署时执行一次）:
+    python -m strategy._indicators_aot
+
+未构建或导入失败时，strategy.indicators 自动回退到 @njit / 纯 Python 内核
+"""
+
+import os
+
+from numba.pycc import CC
+
+from strategy.indicators import _percentile_kernel, _volatility_kernel, _window_60_kernel
+
+
+cc = CC("indicators_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# 导出原始 Python 函数（njit 调度器的 py_func），签名与运行时调用一致
+cc.export("percentile_kernel", "f8(f8[::1], f8)")(_percentile_kernel.py_func)
+cc.export("volatility_kernel", "f8(f8[::1])")(_volatility_kernel.py_func)
+cc.export("window_60_kernel", "UniTuple(f8, 4)(f8[::1])")(_window_60_kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
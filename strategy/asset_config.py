@@ -9,9 +9,12 @@ FundPilot-AI 资产分类与动态阈值配置
 - BOND_PURE: 纯债基金，低波动利率敏感
 """
 
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
+
 
 class AssetClass(Enum):
     """资产类别枚举"""
@@ -45,6 +48,22 @@ class StrategyThresholds:
     
     # 描述
     description: str = ""
+    
+    # 分位区间阈值的 float64 数组副本（供 searchsorted 使用）
+    _zones_np: np.ndarray = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """校验分位区间阈值并缓存为连续 float64 数组"""
+        zones = tuple(float(z) for z in self.zone_thresholds)
+        if len(zones) != 4:
+            raise ValueError(f"分位区间阈值必须为4个: {self.zone_thresholds}")
+        if any(not 0.0 <= z <= 100.0 for z in zones):
+            raise ValueError(f"分位区间阈值必须在 0-100 之间: {self.zone_thresholds}")
+        if any(a >= b for a, b in zip(zones, zones[1:])):
+            raise ValueError(f"分位区间阈值必须严格递增: {self.zone_thresholds}")
+        
+        self.zone_thresholds = zones
+        self._zones_np = np.asarray(zones, dtype=np.float64)
 
 
 # 各资产类型的阈值配置
@@ -114,9 +133,10 @@ ASSET_THRESHOLDS: dict[AssetClass, StrategyThresholds] = {
 }
 
 
+@functools.cache
 def get_thresholds(asset_class: str) -> StrategyThresholds:
     """
-    获取资产类型对应的阈值配置
+    获取资产类型对应的阈值配置（按资产类型字符串缓存）
     
     Args:
         asset_class: 资产类型字符串
@@ -132,6 +152,10 @@ def get_thresholds(asset_class: str) -> StrategyThresholds:
         return ASSET_THRESHOLDS[AssetClass.DEFAULT_ETF]
 
 
+# 分位区间名称（与 zone_thresholds 划分的 5 个区间一一对应）
+_ZONE_NAMES = ("黄金坑", "低估区", "合理区", "偏高区", "高估区")
+
+
 def get_zone_name(percentile: float, thresholds: StrategyThresholds) -> str:
     """
     根据分位值和阈值获取区间名称
@@ -143,17 +167,9 @@ def get_zone_name(percentile: float, thresholds: StrategyThresholds) -> str:
     Returns:
         区间名称
     """
-    z = thresholds.zone_thresholds
-    if percentile < z[0]:
-        return "黄金坑"
-    elif percentile < z[1]:
-        return "低估区"
-    elif percentile < z[2]:
-        return "合理区"
-    elif percentile < z[3]:
-        return "偏高区"
-    else:
-        return "高估区"
+    # side='right'：等于阈值时归入上一区间，与 percentile < z[i] 的判断一致
+    idx = np.searchsorted(thresholds._zones_np, percentile, side="right")
+    return _ZONE_NAMES[idx]
 
 
 def infer_asset_class(fund_type: str, fund_name: str) -> str:
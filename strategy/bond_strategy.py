@@ -14,7 +14,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from strategy.indicators import QuantMetrics, get_dynamic_ma_threshold, get_dynamic_drop_threshold
-from strategy.etf_strategy import Decision, StrategyResult
+from strategy.etf_strategy import Decision, StrategyResult, Zone
 from strategy.asset_config import get_thresholds, AssetClass, infer_asset_class
 from core.logger import get_logger
 
@@ -164,9 +164,9 @@ def evaluate_bond_strategy(
         return StrategyResult(
             decision=Decision.HOLD,
             confidence=0.3,
-            reasoning=f"触发熔断：债券单日大跌 {metrics.daily_change:.2f}%（阈值 {circuit_breaker:.1f}%），极为罕见，建议冷静观察后决策",
-            zone="熔断",
-            warnings=[f"债券极端行情：跌幅罕见（{asset_class}），可能有重大风险事件"]
+            reason_template=f"触发熔断：债券单日大跌 {metrics.daily_change:.2f}%（阈值 {circuit_breaker:.1f}%），极为罕见，建议冷静观察后决策",
+            zone=Zone.BREAKER,
+            extra_warnings=(f"债券极端行情：跌幅罕见（{asset_class}），可能有重大风险事件",)
         )
     
     signal = detect_bond_signal(metrics, asset_class)
@@ -208,7 +208,7 @@ def evaluate_bond_strategy(
             confidence = 0.7
             reasoning = f"250日分位 {metrics.percentile_250:.0f}% 处于高位，债券估值偏贵，建议观望"
         
-        zone = "高估区"
+        zone = Zone.HOT
         
         # 多周期共识强化
         if consensus == "强高估":
@@ -219,9 +219,9 @@ def evaluate_bond_strategy(
         return StrategyResult(
             decision=decision,
             confidence=confidence,
-            reasoning=reasoning,
+            reason_template=reasoning,
             zone=zone,
-            warnings=warnings
+            extra_warnings=tuple(warnings)
         )
     
     # === 正常估值区域 ===
@@ -241,7 +241,7 @@ def evaluate_bond_strategy(
             confidence = 0.7
             reasoning = f"债券{signal.signal_type}，可适度加仓"
         
-        zone = "机会区"
+        zone = Zone.OPPORTUNITY
     else:
         # 正常波动：根据资产类型决定默认策略
         # 二级债基应保持定投节奏，纯债可观望
@@ -256,7 +256,7 @@ def evaluate_bond_strategy(
                     reasoning = f"二级债基微跌 {metrics.daily_change:+.2f}%，正是定投好时机"
             else:
                 reasoning = "二级债基平稳运行，建议保持定投节奏"
-            zone = "正常区"
+            zone = Zone.NORMAL
         else:
             # 纯债或其他类型，可观望等待信号
             decision = Decision.HOLD
@@ -268,14 +268,14 @@ def evaluate_bond_strategy(
                     reasoning = f"债券今日微跌 {metrics.daily_change:+.2f}%，属正常波动无需担忧"
             else:
                 reasoning = "债券平稳运行，保持持有即可"
-            zone = "正常区"
+            zone = Zone.NORMAL
     
     logger.info(f"债券策略决策: {decision.value} (信号: {signal.signal_type})")
     
     return StrategyResult(
         decision=decision,
         confidence=confidence,
-        reasoning=reasoning,
+        reason_template=reasoning,
         zone=zone,
-        warnings=warnings
+        extra_warnings=tuple(warnings)
     )
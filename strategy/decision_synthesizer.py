@@ -30,6 +30,9 @@ DECISION_PRIORITY = {
 # 决策反向映射
 PRIORITY_TO_DECISION = {v: k for k, v in DECISION_PRIORITY.items()}
 
+# 枚举 → 优先级（合成时直接按枚举查表，不再解析中文字符串）
+_ENUM_PRIORITY = {d: DECISION_PRIORITY[d.value] for d in Decision}
+
 
 @dataclass
 class SynthesizedDecision:
@@ -68,9 +71,9 @@ def _priority_to_decision(priority: int) -> str:
     return PRIORITY_TO_DECISION.get(priority, "观望")
 
 
-def _get_conservative_decision(d1: str, d2: str) -> str:
+def _compute_conservative_decision(d1: str, d2: str) -> str:
     """
-    获取保守决策（取两者中间值，偏向观望）
+    计算保守决策（取两者中间值，偏向观望）
     
     规则：
     - 双倍补仓 vs 观望 → 正常定投
@@ -90,6 +93,29 @@ def _get_conservative_decision(d1: str, d2: str) -> str:
         return _priority_to_decision(max(min(p1, p2), 2))
 
 
+# 保守决策查找表：4×4 种决策组合在模块加载时预先计算
+_CONSERVATIVE: dict[tuple[str, str], str] = {
+    (d1, d2): _compute_conservative_decision(d1, d2)
+    for d1 in DECISION_PRIORITY
+    for d2 in DECISION_PRIORITY
+}
+
+
+def _resolve_ai_decision(ai_result: AIDecisionResult) -> Optional[Decision]:
+    """获取 AI 决策枚举（优先使用 decision_enum，否则解析字符串，无法识别时返回 None）"""
+    if ai_result.decision_enum is not None:
+        return ai_result.decision_enum
+    try:
+        return Decision(ai_result.decision)
+    except ValueError:
+        return None
+
+
+def _get_conservative_decision(d1: str, d2: str) -> str:
+    """获取保守决策（查表，未知决策返回观望）"""
+    return _CONSERVATIVE.get((d1, d2), "观望")
+
+
 def synthesize_decisions(
     strategy_result: StrategyResult,
     ai_result: Optional[AIDecisionResult],
@@ -133,6 +159,7 @@ def synthesize_decisions(
         )
     
     ai_decision = ai_result.decision
+    ai_decision_enum = _resolve_ai_decision(ai_result)
     ai_confidence_str = ai_result.confidence
     ai_confidence = confidence_to_score(ai_confidence_str)
     
@@ -141,8 +168,8 @@ def synthesize_decisions(
     ai_weight = thresholds.ai_weight
     strategy_weight = 1 - ai_weight
     
-    # 判断是否一致
-    is_consistent = (strategy_decision == ai_decision)
+    # 判断是否一致（无法识别的 AI 决策视为不一致）
+    is_consistent = strategy_result.decision is ai_decision_enum
     
     if is_consistent:
         # 两者一致：信心度加成
@@ -154,7 +181,8 @@ def synthesize_decisions(
         logger.info(f"决策一致: {final_decision} (加成后信心: {combined_confidence:.0%})")
     else:
         # 两者分歧：根据权重和保守原则处理
-        diff = abs(_decision_to_priority(strategy_decision) - _decision_to_priority(ai_decision))
+        # 无法识别的 AI 决策按观望的优先级计算分歧
+        diff = abs(_ENUM_PRIORITY[strategy_result.decision] - _ENUM_PRIORITY.get(ai_decision_enum, 2))
         
         if diff >= 2:
             # 极端分歧：保守处理
@@ -166,8 +194,8 @@ def synthesize_decisions(
             
             logger.info(f"极端分歧: 策略={strategy_decision}, AI={ai_decision}, 最终保守={final_decision}")
         else:
-            # 轻度分歧：根据权重选择
-            if ai_confidence > strategy_confidence and ai_weight >= 0.5:
+            # 轻度分歧：根据权重选择（无法识别的 AI 决策不采纳）
+            if ai_decision_enum is not None and ai_confidence > strategy_confidence and ai_weight >= 0.5:
                 final_decision = ai_decision
                 combined_confidence = ai_confidence * ai_weight + strategy_confidence * strategy_weight
                 synthesis_method = f"AI主导 (权重{ai_weight:.0%})"
@@ -0,0 +1,90 @@
+"""
+FundPilot-AI ETF 策略数值内核
+不涉及字符串与日志的纯数值决策逻辑，安装 numba 时 JIT 编译
+
+决策理由、风险提示和日志由 strategy.etf_strategy 负责
+"""
+
+import numpy as np
+
+from core.jit import njit
+
+
+# 决策编码（对应 etf_strategy._DECISION_CODES）
+DOUBLE_BUY, NORMAL_BUY, HOLD, STOP_BUY = range(4)
+
+# 区间编码：0-4 为分位区间（黄金坑/低估/合理/偏高/高估），5 为熔断
+ZONE_BREAKER = 5
+
+# 决策理由模板编号（对应 etf_strategy._TEMPLATES）
+(
+    T_BREAKER_DROP, T_BREAKER_RISE,
+    T_PIT, T_PIT_UNCONFIRMED,
+    T_LOW_CONSENSUS, T_LOW_ZONE,
+    T_FAIR_BELOW_THRESHOLD, T_FAIR_BELOW_MA, T_FAIR_ABOVE_MA,
+    T_HIGH_CONSENSUS, T_HIGH_ZONE,
+    T_GOLD_HEDGE, T_GOLD_HOLD,
+    T_TOP_CONSENSUS, T_TOP_ZONE,
+) = range(15)
+
+
+@njit(cache=True)
+def decide_core(
+    percentile: float,
+    ma_deviation: float,
+    daily_change: float,
+    cons_code: int,
+    zones: np.ndarray,
+    ma_threshold: float,
+    cb_drop: float,
+    cb_rise: float,
+    hedge: bool,
+    lut_decision: np.ndarray,
+    lut_confidence: np.ndarray,
+    lut_tmpl: np.ndarray
+) -> tuple[int, int, float, int]:
+    """
+    ETF 策略决策内核
+    
+    Args:
+        percentile: 250日分位值
+        ma_deviation: 均线偏离度 (%)
+        daily_change: 当日涨跌幅 (%)，NaN 表示无数据（不触发熔断）
+        cons_code: 多周期共识编码
+        zones: 分位区间阈值 (float64 连续数组)
+        ma_threshold: 动态均线偏离阈值（负值）
+        cb_drop: 熔断跌幅阈值
+        cb_rise: 熔断涨幅阈值
+        hedge: 是否满足黄金对冲条件（大盘暴跌）
+        lut_decision / lut_confidence / lut_tmpl: 决策查找表的三列 (5×5)
+    
+    Returns:
+        (区间编码, 决策编码, 置信度, 理由模板编号)
+    """
+    # 熔断检查（NaN 比较恒为 False）
+    if daily_change < cb_drop:
+        return ZONE_BREAKER, HOLD, 0.3, T_BREAKER_DROP
+    if daily_change > cb_rise:
+        return ZONE_BREAKER, HOLD, 0.3, T_BREAKER_RISE
+    
+    # 分位区间：统计不大于分位值的阈值个数，等于阈值时归入上一区间
+    # （与 np.searchsorted(side="right") 一致：NaN 不小于任何阈值，归入最高区间）
+    bucket = 0
+    for i in range(zones.shape[0]):
+        if not percentile < zones[i]:
+            bucket += 1
+    
+    # 合理区：依据均线位置和动态阈值覆盖
+    if bucket == 2:
+        if ma_deviation < ma_threshold:
+            return bucket, NORMAL_BUY, 0.65, T_FAIR_BELOW_THRESHOLD
+        if ma_deviation < 0:
+            return bucket, NORMAL_BUY, 0.55, T_FAIR_BELOW_MA
+    
+    tmpl = int(lut_tmpl[bucket, cons_code])
+    
+    # 黄金高估区：大盘暴跌时对冲价值显现
+    if hedge and tmpl == T_GOLD_HOLD:
+        return bucket, NORMAL_BUY, 0.65, T_GOLD_HEDGE
+    
+    return bucket, int(lut_decision[bucket, cons_code]), float(lut_confidence[bucket, cons_code]), tmpl
@@ -10,43 +10,284 @@ FundPilot-AI 策略 A - ETF 联接基金网格交易策略
 - 极端行情熔断机制
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import Optional
+import logging
+import math
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Optional, Sequence
+
+import numpy as np
 
 from strategy.indicators import QuantMetrics, get_dynamic_ma_threshold
 from strategy.asset_config import (
     AssetClass, StrategyThresholds, 
-    get_thresholds, get_zone_name, infer_asset_class
+    get_thresholds, infer_asset_class, _ZONE_NAMES
+)
+from strategy.etf_kernel import (
+    DOUBLE_BUY, NORMAL_BUY, HOLD, STOP_BUY, ZONE_BREAKER,
+    T_BREAKER_DROP, T_BREAKER_RISE, T_PIT, T_PIT_UNCONFIRMED,
+    T_LOW_CONSENSUS, T_LOW_ZONE, T_FAIR_BELOW_THRESHOLD, T_FAIR_BELOW_MA, T_FAIR_ABOVE_MA,
+    T_HIGH_CONSENSUS, T_HIGH_ZONE, T_GOLD_HEDGE, T_GOLD_HOLD, T_TOP_CONSENSUS, T_TOP_ZONE,
+    decide_core
 )
 from core.logger import get_logger
 
 logger = get_logger("etf_strategy")
 
 
-class Decision(Enum):
-    """决策类型"""
+class Decision(str, Enum):
+    """决策类型（str 混入：成员即其中文值，比较与哈希走 str 的 C 实现）"""
     DOUBLE_BUY = "双倍补仓"
     NORMAL_BUY = "正常定投"
     HOLD = "观望"
     STOP_BUY = "暂停定投"
 
 
-@dataclass
+# 决策展示文本（日志等热路径直接查表，不经过 Enum 的 value 描述符）
+_DECISION_DISPLAY = {d: d.value for d in Decision}
+
+
+class Zone(IntEnum):
+    """分位区间（0-5 与 etf_kernel 区间编码一致）"""
+    GOLD_PIT = 0        # 黄金坑
+    UNDERVALUED = 1     # 低估区
+    FAIR = 2            # 合理区
+    OVERVALUED = 3      # 偏高区
+    HOT = 4             # 高估区
+    BREAKER = 5         # 熔断
+    OPPORTUNITY = 6     # 机会区（债券）
+    NORMAL = 7          # 正常区（债券）
+    
+    @property
+    def label(self) -> str:
+        """区间中文描述"""
+        return _ZONE_LABELS[self]
+
+
+# 区间中文描述（按 Zone 编码索引）
+_ZONE_LABELS = _ZONE_NAMES + ("熔断", "机会区", "正常区")
+_ZONES = tuple(Zone)
+
+
+# 风险提示位标志（StrategyResult.warning_flags）
+W_DIVERGENCE = 1 << 0           # 多周期分位分歧
+W_UPTREND_HIGH = 1 << 1         # 上升趋势 + 高于高估阈值
+W_DOWNTREND_LOW = 1 << 2        # 下降趋势 + 低于低估阈值
+W_FAKE_UNDERVALUED = 1 << 3     # 黄金坑未获多周期确认
+W_GOLD_HINT = 1 << 4            # 黄金避险属性提示
+W_CYCLE_HINT = 1 << 5           # 周期资产提示
+W_DIVERGENCE_SOFTEN = 1 << 6    # 高估区分歧，可减少暂停力度
+W_CRASH_HEDGE = 1 << 7          # 大盘下跌时黄金对冲
+
+# 风险提示文本（部分为模板，使用 reason_args 格式化），按展开顺序排列
+_WARNING_TEXTS = (
+    (W_DIVERGENCE, "多周期分位分歧：60日={percentile_60:.0f}%，250日={percentile:.0f}%，500日={percentile_500:.0f}%"),
+    (W_UPTREND_HIGH, "短期强于长期，可能处于趋势高点"),
+    (W_DOWNTREND_LOW, "短期弱于长期，可能仍有下跌空间"),
+    (W_GOLD_HINT, "黄金为避险资产，高估不一定暂停，需考虑对冲需求"),
+    (W_CYCLE_HINT, "周期资产易长期处于极端分位，需逆向思维"),
+    (W_CRASH_HEDGE, "大盘下跌时黄金具备对冲价值"),
+    (W_FAKE_UNDERVALUED, "长期分位偏高，短期低估可能是假象"),
+    (W_DIVERGENCE_SOFTEN, "多周期存在分歧，可小幅减少暂停力度"),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class StrategyResult:
-    """策略决策结果"""
+    """
+    策略决策结果
+    
+    决策理由以 (模板, 参数) 形式保存，首次读取 reasoning 时才格式化；
+    reason_args 为空时 reason_template 即为理由原文。
+    风险提示同理：ETF 策略只记录位标志 warning_flags，首次读取 warnings 时展开，
+    其他来源的提示原文放在 extra_warnings 中
+    """
     decision: Decision
     confidence: float       # 置信度 (0-1)
-    reasoning: str          # 决策理由
-    zone: str               # 分位区间描述
-    warnings: list[str]     # 风险提示列表
+    reason_template: str    # 决策理由模板
+    zone: Zone              # 分位区间
+    warning_flags: int = 0                  # 风险提示位标志（W_*）
+    extra_warnings: tuple[str, ...] = ()    # 风险提示原文（熔断 / 债券策略）
+    reason_args: Optional[dict] = field(default=None, hash=False)  # 决策理由模板参数
+    _reasoning: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _warnings: Optional[list[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def reasoning(self) -> str:
+        """决策理由（首次读取时格式化并缓存）"""
+        if self._reasoning is None:
+            if self.reason_args:
+                reasoning = self.reason_template.format(**self.reason_args)
+            else:
+                reasoning = self.reason_template
+            object.__setattr__(self, "_reasoning", reasoning)
+        return self._reasoning
+    
+    @property
+    def warnings(self) -> list[str]:
+        """风险提示列表（首次读取时由位标志展开并缓存）"""
+        if self._warnings is None:
+            warnings = list(self.extra_warnings)
+            flags = self.warning_flags
+            if flags:
+                for bit, text in _WARNING_TEXTS:
+                    if flags & bit:
+                        warnings.append(text.format(**self.reason_args) if bit == W_DIVERGENCE else text)
+            object.__setattr__(self, "_warnings", warnings)
+        return self._warnings
+
+
+# 决策 / 共识的整数编码（查找表与批量接口共用）
+_DECISION_CODES = (Decision.DOUBLE_BUY, Decision.NORMAL_BUY, Decision.HOLD, Decision.STOP_BUY)
+_CONSENSUS_LABELS = ("强低估", "弱低估", "分歧", "弱高估", "强高估")
+_CONS_IDX = {c: i for i, c in enumerate(_CONSENSUS_LABELS)}
+
+# 决策理由模板（按 etf_kernel 理由模板编号索引）
+_TEMPLATES = {
+    T_BREAKER_DROP: "触发熔断：单日大跌 {daily_change:.1f}%，建议冷静观察，次日再决策",
+    T_BREAKER_RISE: "触发熔断：单日大涨 {daily_change:.1f}%，建议冷静观察，次日再决策",
+    T_PIT: "250日分位 {percentile:.1f}%（<{pit:.0f}%），多周期共识「{consensus}」，珍惜黄金坑加仓机会",
+    T_PIT_UNCONFIRMED: "250日分位 {percentile:.1f}% 处于黄金坑，但多周期「{consensus}」，建议正常定投观察",
+    T_LOW_CONSENSUS: "250日分位 {percentile:.1f}%，多周期共识「{consensus}」，适合正常定投",
+    T_LOW_ZONE: "250日分位 {percentile:.1f}%，处于{zone}，可正常定投",
+    T_FAIR_BELOW_THRESHOLD: "250日分位 {percentile:.1f}%，低于均线 {ma_gap:.1f}%（阈值 {ma_threshold:.1f}%），可正常定投",
+    T_FAIR_BELOW_MA: "250日分位 {percentile:.1f}%，略低于均线，可正常定投",
+    T_FAIR_ABOVE_MA: "250日分位 {percentile:.1f}%，处于{zone}且高于均线，可观望等待机会",
+    T_HIGH_CONSENSUS: "250日分位 {percentile:.1f}%，多周期共识「{consensus}」，严禁追高",
+    T_HIGH_ZONE: "250日分位 {percentile:.1f}%，处于{zone}，建议观望不追高",
+    T_GOLD_HEDGE: "250日分位 {percentile:.1f}%，黄金高估但大盘跌 {market_gap:.1f}%，对冲配置价值显现，建议正常定投",
+    T_GOLD_HOLD: "250日分位 {percentile:.1f}%，黄金高估但具避险价值，建议观望而非暂停",
+    T_TOP_CONSENSUS: "250日分位 {percentile:.1f}%，多周期共识「{consensus}」，坚决暂停定投积攒弹药",
+    T_TOP_ZONE: "250日分位 {percentile:.1f}%，处于{zone}，建议暂停定投积攒弹药",
+}
+
+_LUT_DTYPE = np.dtype([("decision", "i1"), ("confidence", "f8"), ("tmpl_id", "i2")])
+
+
+def _build_decision_lut(asset_class: str) -> np.ndarray:
+    """
+    构建决策查找表：(分位区间 0-4) × (多周期共识 0-4) → (决策, 置信度, 理由模板)
+    
+    合理区的均线判断和黄金高估区的大盘对冲判断不在表内，查表后再覆盖
+    """
+    lut = np.zeros((len(_ZONE_NAMES), len(_CONSENSUS_LABELS)), dtype=_LUT_DTYPE)
+    is_gold = asset_class == AssetClass.GOLD_ETF.value
+    
+    for c, consensus in enumerate(_CONSENSUS_LABELS):
+        low = consensus in ("强低估", "弱低估")
+        high = consensus in ("强高估", "弱高估")
+        
+        # 黄金坑：双倍补仓（需多周期确认）
+        if low:
+            lut[0, c] = (DOUBLE_BUY, 0.9 if consensus == "强低估" else 0.75, T_PIT)
+        else:
+            lut[0, c] = (NORMAL_BUY, 0.6, T_PIT_UNCONFIRMED)
+        
+        # 低估区：正常定投
+        lut[1, c] = (NORMAL_BUY, 0.8, T_LOW_CONSENSUS) if low else (NORMAL_BUY, 0.65, T_LOW_ZONE)
+        
+        # 合理区：默认高于均线观望
+        lut[2, c] = (HOLD, 0.5, T_FAIR_ABOVE_MA)
+        
+        # 偏高区：观望
+        lut[3, c] = (HOLD, 0.85, T_HIGH_CONSENSUS) if high else (HOLD, 0.7, T_HIGH_ZONE)
+        
+        # 高估区：黄金默认观望，其余暂停定投
+        if is_gold:
+            lut[4, c] = (HOLD, 0.6, T_GOLD_HOLD)
+        else:
+            lut[4, c] = (STOP_BUY, 0.95, T_TOP_CONSENSUS) if high else (STOP_BUY, 0.8, T_TOP_ZONE)
+    
+    return lut
+
+
+_DECISION_LUT: dict[str, np.ndarray] = {ac.value: _build_decision_lut(ac.value) for ac in AssetClass}
+
+
+# 决策内核使用的按列拆分的连续查找表 (decision, confidence, tmpl_id)
+_KERNEL_LUT: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = {
+    ac: tuple(np.ascontiguousarray(lut[name]) for name in _LUT_DTYPE.names)
+    for ac, lut in _DECISION_LUT.items()
+}
+
+
+# 决策内核直接映射缓存：512 个槽位，按完整输入精确匹配，槽位冲突时新结果直接覆盖
+_KERNEL_CACHE_SIZE = 512
+_kernel_cache: list[Optional[tuple]] = [None] * _KERNEL_CACHE_SIZE
+
+
+def _decide(
+    asset_class: str,
+    percentile: float,
+    ma_deviation: float,
+    daily_change: Optional[float],
+    cons_code: int,
+    thresholds: StrategyThresholds,
+    ma_threshold: float,
+    hedge: bool,
+    memoize: bool
+) -> tuple[int, int, float, int]:
+    """调用决策内核，memoize 时先查直接映射缓存"""
+    if memoize:
+        key = (asset_class, percentile, ma_deviation, daily_change, cons_code, ma_threshold, hedge)
+        slot = hash(key) & (_KERNEL_CACHE_SIZE - 1)
+        entry = _kernel_cache[slot]
+        if entry is not None and entry[0] == key:
+            return entry[1]
+    
+    lut_decision, lut_confidence, lut_tmpl = _KERNEL_LUT.get(asset_class, _KERNEL_LUT[AssetClass.DEFAULT_ETF.value])
+    result = decide_core(
+        percentile,
+        ma_deviation,
+        daily_change if daily_change is not None else math.nan,
+        cons_code,
+        thresholds._zones_np,
+        ma_threshold,
+        thresholds.circuit_breaker_drop,
+        thresholds.circuit_breaker_rise,
+        hedge,
+        lut_decision,
+        lut_confidence,
+        lut_tmpl
+    )
+    
+    if memoize:
+        # 键值成对写入同一槽位，避免多线程下键值错配
+        _kernel_cache[slot] = (key, result)
+    return result
+
+
+def _get_decision_lut(asset_class: Optional[str]) -> np.ndarray:
+    """获取资产类型对应的决策查找表（未知类型使用默认 ETF）"""
+    return _DECISION_LUT.get(asset_class, _DECISION_LUT[AssetClass.DEFAULT_ETF.value])
+
+
+@dataclass
+class StrategyBatchResult:
+    """批量策略决策结果（按列存储，仅在读取单行时才还原为枚举/字符串）"""
+    decision_codes: np.ndarray   # int8，索引 _DECISION_CODES
+    confidence: np.ndarray       # float32 置信度
+    zone_codes: np.ndarray       # int8，Zone 编码
+    
+    def __len__(self) -> int:
+        return len(self.decision_codes)
+    
+    def decision(self, i: int) -> Decision:
+        """第 i 只基金的决策"""
+        return _DECISION_CODES[self.decision_codes[i]]
+    
+    def zone(self, i: int) -> Zone:
+        """第 i 只基金的分位区间"""
+        return _ZONES[self.zone_codes[i]]
 
 
 def evaluate_etf_strategy(
     metrics: QuantMetrics, 
     asset_class: Optional[str] = None,
     fund_name: str = "",
-    market_drop: Optional[float] = None
+    market_drop: Optional[float] = None,
+    memoize: bool = True
 ) -> StrategyResult:
     """
     评估 ETF 联接基金策略（资产感知版 v3.1）
@@ -63,12 +304,11 @@ def evaluate_etf_strategy(
         asset_class: 资产类别 (GOLD_ETF / COMMODITY_CYCLE 等)
         fund_name: 基金名称（用于推断 asset_class）
         market_drop: 大盘跌幅（负值，用于黄金对冲判断）
+        memoize: 是否缓存数值决策结果（回测等重复输入场景受益，结果与不缓存时完全一致）
     
     Returns:
         StrategyResult 决策结果
     """
-    warnings: list[str] = []
-    
     # === 获取资产类型对应的阈值 ===
     if not asset_class:
         asset_class = infer_asset_class("ETF_Feeder", fund_name)
@@ -76,144 +316,123 @@ def evaluate_etf_strategy(
     thresholds = get_thresholds(asset_class)
     zones = thresholds.zone_thresholds  # (黄金坑, 低估, 高估, 过热)
     
-    logger.debug(f"使用资产类型 {asset_class} 阈值: {zones}")
-    
-    # === 熔断检查 ===
-    if metrics.daily_change is not None:
-        if metrics.daily_change < thresholds.circuit_breaker_drop:
-            return StrategyResult(
-                decision=Decision.HOLD,
-                confidence=0.3,
-                reasoning=f"触发熔断：单日大跌 {metrics.daily_change:.1f}%，建议冷静观察，次日再决策",
-                zone="熔断",
-                warnings=["极端行情熔断：跌幅过大，暂停决策"]
-            )
-        if metrics.daily_change > thresholds.circuit_breaker_rise:
-            return StrategyResult(
-                decision=Decision.HOLD,
-                confidence=0.3,
-                reasoning=f"触发熔断：单日大涨 {metrics.daily_change:.1f}%，建议冷静观察，次日再决策",
-                zone="熔断",
-                warnings=["极端行情熔断：涨幅过大，暂停决策"]
-            )
-    
-    # === 多周期分位共识 ===
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("使用资产类型 %s 阈值: %s", asset_class, zones)
+    
     percentile = metrics.percentile_250  # 主要参考
     consensus = metrics.percentile_consensus
-    trend = metrics.trend_direction
-    zone = get_zone_name(percentile, thresholds)
     
     # 动态均线偏离阈值（结合波动率和资产基准）
     volatility_threshold = get_dynamic_ma_threshold(metrics.volatility_60)
     dynamic_ma_threshold = min(volatility_threshold, thresholds.ma_base_threshold)
     
+    # === 数值决策内核：熔断 → 分位区间 × 多周期共识查表 → 均线/对冲覆盖 ===
+    zone_code, decision_code, confidence, tmpl_id = _decide(
+        asset_class,
+        percentile,
+        metrics.ma_deviation,
+        metrics.daily_change,
+        _CONS_IDX[consensus],
+        thresholds,
+        dynamic_ma_threshold,
+        market_drop is not None and market_drop < -2.0,
+        memoize
+    )
+    
+    # === 熔断 ===
+    if zone_code == ZONE_BREAKER:
+        direction = "跌幅" if tmpl_id == T_BREAKER_DROP else "涨幅"
+        return StrategyResult(
+            decision=Decision.HOLD,
+            confidence=confidence,
+            reason_template=_TEMPLATES[tmpl_id],
+            zone=Zone.BREAKER,
+            extra_warnings=(f"极端行情熔断：{direction}过大，暂停决策",),
+            reason_args={"daily_change": metrics.daily_change}
+        )
+    
+    trend = metrics.trend_direction
+    zone = _ZONES[zone_code]
+    
     # 共识冲突警告
+    flags = 0
     if consensus == "分歧":
-        warnings.append(f"多周期分位分歧：60日={metrics.percentile_60:.0f}%，250日={metrics.percentile_250:.0f}%，500日={metrics.percentile_500:.0f}%")
+        flags |= W_DIVERGENCE
     
     # 趋势警告
     if trend == "上升趋势" and percentile > zones[2]:  # 高于高估阈值
-        warnings.append("短期强于长期，可能处于趋势高点")
+        flags |= W_UPTREND_HIGH
     if trend == "下降趋势" and percentile < zones[1]:  # 低于低估阈值
-        warnings.append("短期弱于长期，可能仍有下跌空间")
+        flags |= W_DOWNTREND_LOW
     
     # === 资产特性提示（仅在特定条件下显示）===
     if asset_class == AssetClass.GOLD_ETF.value and percentile < zones[3]:
         # 只在非高估区提示，高估区有专门逻辑
-        warnings.append("黄金为避险资产，高估不一定暂停，需考虑对冲需求")
+        flags |= W_GOLD_HINT
     elif asset_class == AssetClass.COMMODITY_CYCLE.value:
-        warnings.append("周期资产易长期处于极端分位，需逆向思维")
+        flags |= W_CYCLE_HINT
     
-    # === 决策逻辑（使用动态阈值）===
-    decision: Decision
-    confidence: float
-    reasoning: str
-    
-    # 黄金坑：双倍补仓（需多周期确认）
-    if percentile < zones[0]:  # 动态黄金坑阈值
-        if consensus in ["强低估", "弱低估"]:
-            decision = Decision.DOUBLE_BUY
-            confidence = 0.9 if consensus == "强低估" else 0.75
-            reasoning = f"250日分位 {percentile:.1f}%（<{zones[0]:.0f}%），多周期共识「{consensus}」，珍惜黄金坑加仓机会"
-        else:
-            # 短期分位与长期不一致，谨慎处理
-            decision = Decision.NORMAL_BUY
-            confidence = 0.6
-            reasoning = f"250日分位 {percentile:.1f}% 处于黄金坑，但多周期「{consensus}」，建议正常定投观察"
-            warnings.append("长期分位偏高，短期低估可能是假象")
-    
-    # 低估区：正常定投
-    elif percentile < zones[1]:  # 动态低估阈值
-        decision = Decision.NORMAL_BUY
-        if consensus in ["强低估", "弱低估"]:
-            confidence = 0.8
-            reasoning = f"250日分位 {percentile:.1f}%，多周期共识「{consensus}」，适合正常定投"
-        else:
-            confidence = 0.65
-            reasoning = f"250日分位 {percentile:.1f}%，处于{zone}，可正常定投"
-    
-    # 合理区：观望或正常定投（依据均线位置和动态阈值）
-    elif percentile < zones[2]:  # 动态高估阈值
-        if metrics.ma_deviation < dynamic_ma_threshold:
-            # 显著低于均线
-            decision = Decision.NORMAL_BUY
-            confidence = 0.65
-            reasoning = f"250日分位 {percentile:.1f}%，低于均线 {abs(metrics.ma_deviation):.1f}%（阈值 {abs(dynamic_ma_threshold):.1f}%），可正常定投"
-        elif metrics.ma_deviation < 0:
-            decision = Decision.NORMAL_BUY
-            confidence = 0.55
-            reasoning = f"250日分位 {percentile:.1f}%，略低于均线，可正常定投"
-        else:
-            decision = Decision.HOLD
-            confidence = 0.5
-            reasoning = f"250日分位 {percentile:.1f}%，处于{zone}且高于均线，可观望等待机会"
-    
-    # 偏高区：观望
-    elif percentile < zones[3]:  # 动态过热阈值
-        decision = Decision.HOLD
-        if consensus in ["强高估", "弱高估"]:
-            confidence = 0.85
-            reasoning = f"250日分位 {percentile:.1f}%，多周期共识「{consensus}」，严禁追高"
-        else:
-            confidence = 0.7
-            reasoning = f"250日分位 {percentile:.1f}%，处于{zone}，建议观望不追高"
-    
-    # 高估区：暂停定投
-    else:
-        # 黄金 ETF 特殊处理：考虑大盘表现
-        if asset_class == AssetClass.GOLD_ETF.value:
-            # 大盘暴跌时，黄金高估体现对冲价值，应正常定投
-            if market_drop is not None and market_drop < -2.0:
-                decision = Decision.NORMAL_BUY
-                confidence = 0.65
-                reasoning = f"250日分位 {percentile:.1f}%，黄金高估但大盘跌 {abs(market_drop):.1f}%，对冲配置价值显现，建议正常定投"
-                warnings.append("大盘下跌时黄金具备对冲价值")
-            else:
-                decision = Decision.HOLD
-                confidence = 0.6
-                reasoning = f"250日分位 {percentile:.1f}%，黄金高估但具避险价值，建议观望而非暂停"
-        else:
-            decision = Decision.STOP_BUY
-            if consensus in ["强高估", "弱高估"]:
-                confidence = 0.95
-                reasoning = f"250日分位 {percentile:.1f}%，多周期共识「{consensus}」，坚决暂停定投积攒弹药"
-            else:
-                confidence = 0.8
-                reasoning = f"250日分位 {percentile:.1f}%，处于{zone}，建议暂停定投积攒弹药"
-                if consensus == "分歧":
-                    warnings.append("多周期存在分歧，可小幅减少暂停力度")
+    # === 决策相关提示 ===
+    if tmpl_id == T_GOLD_HEDGE:
+        flags |= W_CRASH_HEDGE
+    elif tmpl_id == T_PIT_UNCONFIRMED:
+        # 短期分位与长期不一致，谨慎处理
+        flags |= W_FAKE_UNDERVALUED
+    elif tmpl_id == T_TOP_ZONE and consensus == "分歧":
+        flags |= W_DIVERGENCE_SOFTEN
+    
+    decision = _DECISION_CODES[decision_code]
     
-    logger.info(f"ETF策略决策: {decision.value} (资产: {asset_class}, 分位: {percentile:.1f}%, 共识: {consensus}, 区间: {zone})")
+    # 批量回测时通常关闭 INFO，先判断级别以跳过格式化
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "ETF策略决策: %s (资产: %s, 分位: %.1f%%, 共识: %s, 区间: %s)",
+            _DECISION_DISPLAY[decision], asset_class, percentile, consensus, zone.label
+        )
     
+    # 决策理由延迟到读取时格式化
     return StrategyResult(
         decision=decision,
         confidence=confidence,
-        reasoning=reasoning,
+        reason_template=_TEMPLATES[tmpl_id],
         zone=zone,
-        warnings=warnings
+        warning_flags=flags,
+        reason_args={
+            "percentile": percentile,
+            "percentile_60": metrics.percentile_60,
+            "percentile_500": metrics.percentile_500,
+            "consensus": consensus,
+            "zone": zone.label,
+            "pit": zones[0],
+            "ma_gap": abs(metrics.ma_deviation),
+            "ma_threshold": abs(dynamic_ma_threshold),
+            "market_gap": abs(market_drop) if market_drop is not None else 0.0
+        }
     )
 
 
+# 补仓倍数表：周期资产分批建仓，避免一次性重仓；其他资产使用标准逻辑
+_CYCLE_MULTIPLIERS = (2.0, 1.5, 1.2, 1.0, 0.8, 0.3, 0.0)     # <5% / 5-10% / 黄金坑 / 低估 / 合理 / 偏高 / 高估
+_STANDARD_MULTIPLIERS = (2.0, 1.5, 1.2, 1.0, 0.5, 0.0)        # 极端低估 / 黄金坑 / 低估 / 合理 / 偏高 / 高估
+
+
+def _build_multiplier_table(asset_class: str) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """构建 (分位分界点, 补仓倍数) 表，分界点数比倍数少 1"""
+    zones = get_thresholds(asset_class).zone_thresholds
+    if asset_class == AssetClass.COMMODITY_CYCLE.value:
+        return (5.0, 10.0) + zones, _CYCLE_MULTIPLIERS
+    return (zones[0] * 0.5,) + zones, _STANDARD_MULTIPLIERS
+
+
+_MULTIPLIER_TABLES = {ac.value: _build_multiplier_table(ac.value) for ac in AssetClass}
+
+# 向量化版本使用的 numpy 表（分界点 float64，倍数 float64）
+_MULT_TABLES: dict[str, tuple[np.ndarray, np.ndarray]] = {
+    ac: (np.asarray(breakpoints, dtype=np.float64), np.asarray(multipliers, dtype=np.float64))
+    for ac, (breakpoints, multipliers) in _MULTIPLIER_TABLES.items()
+}
+
+
 def get_buy_multiplier(
     percentile: float, 
     consensus: str = "分歧",
@@ -236,39 +455,10 @@ def get_buy_multiplier(
     Returns:
         补仓倍数 (1.0 = 正常，2.0 = 双倍，0.0 = 暂停)
     """
-    thresholds = get_thresholds(asset_class or "DEFAULT_ETF")
-    zones = thresholds.zone_thresholds
-    
-    # 周期资产使用分批建仓逻辑，避免一次性重仓
-    if asset_class == "COMMODITY_CYCLE":
-        if percentile < 5.0:
-            base_multiplier = 2.0
-        elif percentile < 10.0:
-            base_multiplier = 1.5
-        elif percentile < zones[0]:  # 15%
-            base_multiplier = 1.2
-        elif percentile < zones[1]:  # 30%
-            base_multiplier = 1.0
-        elif percentile < zones[2]:  # 70%
-            base_multiplier = 0.8
-        elif percentile < zones[3]:  # 90%
-            base_multiplier = 0.3
-        else:
-            base_multiplier = 0.0
-    else:
-        # 其他资产类型使用标准逻辑
-        if percentile < zones[0] * 0.5:  # 极端低估
-            base_multiplier = 2.0
-        elif percentile < zones[0]:  # 黄金坑
-            base_multiplier = 1.5
-        elif percentile < zones[1]:  # 低估区
-            base_multiplier = 1.2
-        elif percentile < zones[2]:  # 合理区
-            base_multiplier = 1.0
-        elif percentile < zones[3]:  # 偏高区
-            base_multiplier = 0.5
-        else:  # 高估区
-            base_multiplier = 0.0
+    breakpoints, multipliers = _MULTIPLIER_TABLES.get(
+        asset_class or "DEFAULT_ETF", _MULTIPLIER_TABLES[AssetClass.DEFAULT_ETF.value]
+    )
+    base_multiplier = multipliers[bisect_right(breakpoints, percentile)]
     
     # 共识调整
     if consensus == "强低估" and base_multiplier > 0:
@@ -277,3 +467,123 @@ def get_buy_multiplier(
         base_multiplier = max(0, base_multiplier * 0.5)
     
     return base_multiplier
+
+
+def get_buy_multiplier_batch(
+    percentiles: np.ndarray,
+    consensus: np.ndarray,
+    asset_class: Optional[str] = None
+) -> np.ndarray:
+    """
+    批量获取补仓倍数（向量化版，结果与 get_buy_multiplier 逐个计算一致）
+    
+    Args:
+        percentiles: 250日分位值数组
+        consensus: 多周期共识数组（与 percentiles 等长）
+        asset_class: 资产类型（整批相同）
+    
+    Returns:
+        补仓倍数数组 (float64)
+    """
+    breakpoints, multipliers = _MULT_TABLES.get(
+        asset_class or "DEFAULT_ETF", _MULT_TABLES[AssetClass.DEFAULT_ETF.value]
+    )
+    out = multipliers[np.searchsorted(breakpoints, percentiles, side="right")]
+    
+    # 共识调整（倍数为 0 时调整后仍为 0）
+    consensus = np.asarray(consensus)
+    out = np.where(consensus == "强低估", np.minimum(2.0, out * 1.2), out)
+    out = np.where(consensus == "强高估", out * 0.5, out)
+    return out
+
+
+def evaluate_etf_strategy_batch(
+    metrics_list: Sequence[QuantMetrics],
+    asset_classes: Sequence[str],
+    market_drop: Optional[float] = None
+) -> StrategyBatchResult:
+    """
+    批量评估 ETF 联接基金策略（向量化版）
+    
+    决策与置信度与 evaluate_etf_strategy 逐只计算的结果一致，
+    但不生成决策理由与风险提示，适用于回测/参数扫描等批量场景。
+    
+    Args:
+        metrics_list: 各基金量化指标
+        asset_classes: 各基金资产类别（与 metrics_list 一一对应）
+        market_drop: 大盘跌幅（负值，用于黄金对冲判断）
+    
+    Returns:
+        StrategyBatchResult 批量决策结果
+    """
+    n = len(metrics_list)
+    
+    def column(attr: str) -> np.ndarray:
+        values = (getattr(m, attr) for m in metrics_list)
+        return np.fromiter((np.nan if v is None else v for v in values), dtype=np.float64, count=n)
+    
+    p60 = column("percentile_60")
+    p250 = column("percentile_250")
+    p500 = column("percentile_500")
+    ma_dev = column("ma_deviation")
+    daily_change = column("daily_change")
+    vol = column("volatility_60")
+    
+    # 多周期共识编码（默认阈值 40/60，与 QuantMetrics.percentile_consensus 一致）
+    low_count = (p60 < 40.0).astype(np.int8) + (p250 < 40.0) + (p500 < 40.0)
+    high_count = (p60 > 60.0).astype(np.int8) + (p250 > 60.0) + (p500 > 60.0)
+    cons_idx = np.select(
+        [low_count == 3, low_count >= 2, high_count == 3, high_count >= 2],
+        [_CONS_IDX["强低估"], _CONS_IDX["弱低估"], _CONS_IDX["强高估"], _CONS_IDX["弱高估"]],
+        _CONS_IDX["分歧"]
+    )
+    
+    # 动态均线偏离阈值（与 get_dynamic_ma_threshold 一致）
+    volatility_threshold = -np.clip(vol / 10, 0.3, 5.0)
+    hedge = market_drop is not None and market_drop < -2.0
+    
+    decision_codes = np.empty(n, dtype=np.int8)
+    confidence = np.empty(n, dtype=np.float32)
+    zone_codes = np.empty(n, dtype=np.int8)
+    
+    classes = np.asarray(asset_classes, dtype=object)
+    for asset_class in set(asset_classes):
+        rows = np.flatnonzero(classes == asset_class)
+        thresholds = get_thresholds(asset_class)
+        
+        bucket = np.searchsorted(thresholds._zones_np, p250[rows], side="right")
+        entry = _get_decision_lut(asset_class)[bucket, cons_idx[rows]]
+        decision = entry["decision"]
+        conf = entry["confidence"]
+        
+        # 合理区：依据均线位置和动态阈值覆盖
+        dev = ma_dev[rows]
+        dynamic_ma = np.minimum(volatility_threshold[rows], thresholds.ma_base_threshold)
+        below_threshold = (bucket == 2) & (dev < dynamic_ma)
+        below_ma = (bucket == 2) & (dev < 0) & ~below_threshold
+        decision[below_threshold | below_ma] = NORMAL_BUY
+        conf[below_threshold] = 0.65
+        conf[below_ma] = 0.55
+        
+        # 黄金高估区：大盘暴跌时正常定投
+        if hedge:
+            hedged = entry["tmpl_id"] == T_GOLD_HOLD
+            decision[hedged] = NORMAL_BUY
+            conf[hedged] = 0.65
+        
+        decision_codes[rows] = decision
+        confidence[rows] = conf
+        zone_codes[rows] = bucket
+        
+        # 熔断：单日涨跌超过阈值（NaN 比较恒为 False，即无当日涨跌时不触发）
+        change = daily_change[rows]
+        breaker = (change < thresholds.circuit_breaker_drop) | (change > thresholds.circuit_breaker_rise)
+        decision_codes[rows[breaker]] = HOLD
+        confidence[rows[breaker]] = 0.3
+        zone_codes[rows[breaker]] = ZONE_BREAKER
+    
+    return StrategyBatchResult(
+        decision_codes=decision_codes,
+        confidence=confidence,
+        zone_codes=zone_codes
+    )
@@ -8,9 +8,20 @@ FundPilot-AI 量化指标计算模块
 - 增加市场体制识别辅助指标
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Optional, Sequence, Union
 import math
+import threading
+
+import numpy as np
+
+from core.jit import NUMBA_AVAILABLE, njit
+from core.logger import get_logger
+from strategy.asset_config import _ZONE_NAMES
+
+logger = get_logger("indicators")
 
 
 # 窗口配置
@@ -19,10 +30,14 @@ PERCENTILE_WINDOW_MID = 250     # 中期分位窗口：250 日（约 1 年）
 PERCENTILE_WINDOW_LONG = 500    # 长期分位窗口：500 日（约 2 年）
 MA_WINDOW = 60                  # 均线计算窗口：60 日
 
+# 波动率年化常数（假设 250 个交易日）：日收益率标准差 * sqrt(250) * 100 = 年化波动率 (%)
+_SQRT_250 = math.sqrt(250.0)
+_SQRT_250_X_100 = _SQRT_250 * 100
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class QuantMetrics:
-    """量化指标集合"""
+    """量化指标集合（不可变，可哈希，可直接作为缓存键）"""
     # 多周期分位值
     percentile_60: float          # 60日分位值 (0-100) - 短期
     percentile_250: float         # 250日分位值 (0-100) - 中期（主要参考）
@@ -46,15 +61,21 @@ class QuantMetrics:
     # 当日涨跌
     daily_change: Optional[float] # 当日涨跌幅 (%)
     
+    # 派生指标缓存（首次读取对应属性时写入，不参与比较与哈希）
+    _percentile_consensus: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _trend_direction: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def percentile_consensus(self) -> str:
         """
-        多周期分位共识判断（使用默认阈值40/60）
+        多周期分位共识判断（使用默认阈值40/60，首次读取时计算并缓存）
         
         Returns:
             共识状态: "强低估" / "弱低估" / "分歧" / "弱高估" / "强高估"
         """
-        return get_percentile_consensus(self, 40.0, 60.0)
+        if self._percentile_consensus is None:
+            object.__setattr__(self, "_percentile_consensus", get_percentile_consensus(self, 40.0, 60.0))
+        return self._percentile_consensus
     
     def get_consensus_with_thresholds(self, low_threshold: float, high_threshold: float) -> str:
         """
@@ -72,18 +93,21 @@ class QuantMetrics:
     @property
     def trend_direction(self) -> str:
         """
-        趋势方向判断（短期 vs 长期分位差异）
+        趋势方向判断（短期 vs 长期分位差异，首次读取时计算并缓存）
         
         Returns:
             趋势: "上升趋势" / "下降趋势" / "震荡"
         """
-        diff = self.percentile_60 - self.percentile_500
-        if diff > 20:
-            return "上升趋势"
-        elif diff < -20:
-            return "下降趋势"
-        else:
-            return "震荡"
+        if self._trend_direction is None:
+            diff = self.percentile_60 - self.percentile_500
+            if diff > 20:
+                trend = "上升趋势"
+            elif diff < -20:
+                trend = "下降趋势"
+            else:
+                trend = "震荡"
+            object.__setattr__(self, "_trend_direction", trend)
+        return self._trend_direction
 
 
 def get_percentile_consensus(
@@ -102,17 +126,14 @@ def get_percentile_consensus(
     Returns:
         共识状态: "强低估" / "弱低估" / "分歧" / "弱高估" / "强高估"
     """
-    short_low = metrics.percentile_60 < low_threshold
-    mid_low = metrics.percentile_250 < low_threshold
-    long_low = metrics.percentile_500 < low_threshold
-    
-    short_high = metrics.percentile_60 > high_threshold
-    mid_high = metrics.percentile_250 > high_threshold
-    long_high = metrics.percentile_500 > high_threshold
-    
-    low_count = sum([short_low, mid_low, long_low])
-    high_count = sum([short_high, mid_high, long_high])
-    
+    p60, p250, p500 = metrics.percentile_60, metrics.percentile_250, metrics.percentile_500
+    low_count = (p60 < low_threshold) + (p250 < low_threshold) + (p500 < low_threshold)
+    high_count = (p60 > high_threshold) + (p250 > high_threshold) + (p500 > high_threshold)
+    return _CONSENSUS_LUT[low_count * 4 + high_count]
+
+
+def _consensus_from_counts(low_count: int, high_count: int) -> str:
+    """由低估/高估周期数判断共识（低估优先）"""
     if low_count == 3:
         return "强低估"
     elif low_count >= 2:
@@ -125,7 +146,23 @@ def get_percentile_consensus(
         return "分歧"
 
 
-def calculate_percentile(current_price: float, prices: list[float]) -> float:
+# 共识查找表：索引为 低估周期数 * 4 + 高估周期数（各 0-3）
+_CONSENSUS_LUT = tuple(_consensus_from_counts(i // 4, i % 4) for i in range(16))
+
+
+def _head(prices: Union[Sequence[float], np.ndarray], n: int) -> np.ndarray:
+    """
+    取最近 n 个价格为 float64 数组（所有窗口截取的统一入口）
+    
+    切片超出长度时即为全部数据，无需先比较 len 与窗口大小；
+    ndarray 切片为视图（float64 时零拷贝），列表经 islice 直接填充数组，不生成中间切片列表
+    """
+    if isinstance(prices, np.ndarray):
+        return prices[:n].astype(np.float64, copy=False)
+    return np.fromiter(islice(prices, n), dtype=np.float64)
+
+
+def calculate_percentile(current_price: float, prices: Union[Sequence[float], np.ndarray]) -> float:
     """
     计算分位值
     
@@ -133,44 +170,78 @@ def calculate_percentile(current_price: float, prices: list[float]) -> float:
     
     Args:
         current_price: 当前价格（预估净值）
-        prices: 历史价格列表
+        prices: 历史价格列表或 numpy 数组（视图）
     
     Returns:
         分位值百分比 (0-100)
     """
-    if not prices:
+    if len(prices) == 0:
         return 50.0
     
-    max_price = max(prices)
-    min_price = min(prices)
+    view = np.ascontiguousarray(prices, dtype=np.float64)
+    return float(_PERCENTILE_KERNEL(view, current_price))
+
+
+@njit(cache=True)
+def _percentile_kernel(prices: np.ndarray, current_price: float) -> float:
+    """
+    分位值内核：单次遍历同时求区间最低/最高价
+    
+    Args:
+        prices: 价格数组（非空）
+        current_price: 当前价格
     
+    Returns:
+        分位值百分比 (0-100)，区间最高等于最低时返回 50
+    """
+    lo = prices[0]
+    hi = prices[0]
+    for i in range(1, prices.shape[0]):
+        v = prices[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    
+    if hi == lo:
+        return 50.0
+    
+    percentile = (current_price - lo) / (hi - lo) * 100
+    return 0.0 if percentile < 0 else (percentile if percentile < 100 else 100.0)
+
+
+def _percentile_in_range(current_price: float, min_price: float, max_price: float) -> float:
+    """已知区间最低/最高价时计算分位值 (0-100)"""
     # 避免除零
     if max_price == min_price:
         return 50.0
     
     percentile = (current_price - min_price) / (max_price - min_price) * 100
     
-    # 限制在 0-100 范围内
-    return max(0, min(100, percentile))
+    return _clip_percentile(percentile)
+
+
+def _clip_percentile(value: float) -> float:
+    """限制在 0-100 范围内（条件表达式代替 max/min 调用，NaN 仍得 100）"""
+    return 0.0 if value < 0 else (value if value < 100 else 100.0)
 
 
-def calculate_ma(prices: list[float], window: int = MA_WINDOW) -> float:
+def calculate_ma(prices: Union[Sequence[float], np.ndarray], window: int = MA_WINDOW) -> float:
     """
     计算移动平均线
     
     Args:
-        prices: 历史价格列表（按时间降序，最新在前）
+        prices: 历史价格列表或 numpy 数组（按时间降序，最新在前）
         window: 窗口大小
     
     Returns:
         移动平均值
     """
-    if not prices:
+    if len(prices) == 0:
         return 0.0
     
-    # 取最近 window 个数据
-    recent_prices = prices[:window] if len(prices) > window else prices
-    return sum(recent_prices) / len(recent_prices)
+    # 取最近 window 个数据（切片超出长度时即为全部数据）
+    return float(_head(prices, window).mean())
 
 
 def calculate_ma_deviation(current_price: float, ma: float) -> float:
@@ -209,14 +280,14 @@ def calculate_drawdown(current_price: float, peak_price: float) -> float:
     return max(0, (peak_price - current_price) / peak_price * 100)
 
 
-def calculate_volatility(prices: list[float], window: int = 60) -> float:
+def calculate_volatility(prices: Union[Sequence[float], np.ndarray], window: int = 60) -> float:
     """
     计算年化波动率
     
     公式: 日收益率标准差 * sqrt(250)
     
     Args:
-        prices: 历史价格列表（按时间降序，最新在前）
+        prices: 历史价格列表或 numpy 数组（按时间降序，最新在前）
         window: 计算窗口
     
     Returns:
@@ -225,51 +296,164 @@ def calculate_volatility(prices: list[float], window: int = 60) -> float:
     if len(prices) < 2:
         return 0.0
     
-    # 取最近 window 个数据
-    recent_prices = prices[:window] if len(prices) > window else prices
+    # 取最近 window 个数据（切片超出长度时即为全部数据）
+    recent_prices = np.ascontiguousarray(_head(prices, window))
+    return _VOLATILITY_KERNEL(recent_prices)
+
+
+@njit(cache=True)
+def _volatility_kernel(prices: np.ndarray) -> float:
+    """
+    年化波动率内核：单次遍历计算日收益率，并用 Welford 算法累计样本方差
     
-    if len(recent_prices) < 2:
-        return 0.0
+    Args:
+        prices: 价格数组（按时间降序，最新在前）
     
-    # 计算日收益率（注意价格是降序的，所以需要反转计算）
-    returns = []
-    for i in range(len(recent_prices) - 1):
+    Returns:
+        年化波动率百分比，有效收益率不足 2 个时返回 0
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(prices.shape[0] - 1):
         # prices[i] 是较新的，prices[i+1] 是较旧的
-        if recent_prices[i + 1] != 0:
-            daily_return = (recent_prices[i] - recent_prices[i + 1]) / recent_prices[i + 1]
-            returns.append(daily_return)
-    
-    if len(returns) < 2:
+        prev = prices[i + 1]
+        if prev != 0:
+            daily_return = (prices[i] - prev) / prev
+            count += 1
+            delta = daily_return - mean
+            mean += delta / count
+            m2 += delta * (daily_return - mean)
+    
+    if count < 2:
         return 0.0
     
-    # 计算标准差
-    mean_return = sum(returns) / len(returns)
-    variance = sum((r - mean_return) ** 2 for r in returns) / (len(returns) - 1)
-    std_dev = math.sqrt(variance)
-    
     # 年化（假设 250 个交易日）
-    annualized_volatility = std_dev * math.sqrt(250) * 100
+    return math.sqrt(m2 / (count - 1)) * _SQRT_250_X_100
+
+
+@njit(cache=True)
+def _window_60_kernel(prices: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    60 日窗口融合内核：一次遍历同时计算均值、最低/最高价和年化波动率
+    
+    均线、短期分位和波动率窗口均为 60 日（MA_WINDOW == PERCENTILE_WINDOW_SHORT），
+    合并为一次线性读取；波动率计算与 _volatility_kernel 一致
     
-    return annualized_volatility
+    Args:
+        prices: 最近 60 个价格（非空，按时间降序）
+    
+    Returns:
+        (均值, 最低价, 最高价, 年化波动率百分比)
+    """
+    n = prices.shape[0]
+    total = 0.0
+    lo = prices[0]
+    hi = prices[0]
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        v = prices[i]
+        total += v
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+        
+        if i + 1 < n:
+            prev = prices[i + 1]
+            if prev != 0:
+                daily_return = (v - prev) / prev
+                count += 1
+                delta = daily_return - mean
+                mean += delta / count
+                m2 += delta * (daily_return - mean)
+    
+    volatility = 0.0
+    if count >= 2:
+        volatility = math.sqrt(m2 / (count - 1)) * _SQRT_250_X_100
+    
+    return total / n, lo, hi, volatility
+
+
+def _percentile_numpy(prices: np.ndarray, current_price: float) -> float:
+    """_percentile_kernel 的 numpy 实现（未安装 numba 时使用）"""
+    return _percentile_in_range(current_price, float(prices.min()), float(prices.max()))
+
+
+def _volatility_numpy(prices: np.ndarray) -> float:
+    """_volatility_kernel 的 numpy 实现（未安装 numba 时使用）：向量化计算日收益率后求样本标准差"""
+    newer, older = prices[:-1], prices[1:]
+    valid = older != 0
+    returns = (newer[valid] - older[valid]) / older[valid]
+    if returns.size < 2:
+        return 0.0
+    return float(returns.std(ddof=1)) * _SQRT_250_X_100
+
+
+def _window_60_numpy(prices: np.ndarray) -> tuple[float, float, float, float]:
+    """_window_60_kernel 的 numpy 实现（未安装 numba 时使用）"""
+    return float(prices.mean()), float(prices.min()), float(prices.max()), _volatility_numpy(prices)
+
+
+# 优先使用 AOT 预编译内核（python -m strategy._indicators_aot 构建），其次 @njit 版本；
+# 未安装 numba 时逐元素的 Python 循环很慢，改用 numpy 向量化实现
+try:
+    from strategy.indicators_native import (
+        percentile_kernel as _PERCENTILE_KERNEL,
+        volatility_kernel as _VOLATILITY_KERNEL,
+        window_60_kernel as _WINDOW_60_KERNEL
+    )
+except ImportError:
+    if NUMBA_AVAILABLE:
+        _PERCENTILE_KERNEL = _percentile_kernel
+        _VOLATILITY_KERNEL = _volatility_kernel
+        _WINDOW_60_KERNEL = _window_60_kernel
+    else:
+        _PERCENTILE_KERNEL = _percentile_numpy
+        _VOLATILITY_KERNEL = _volatility_numpy
+        _WINDOW_60_KERNEL = _window_60_numpy
+
+
+# calculate_all_metrics 结果缓存：键为 (当前价, 当日涨跌, 历史净值原始字节)，
+# 内容完全相同才命中；超出容量时淘汰最早写入的条目
+_METRICS_CACHE_SIZE = 256
+_metrics_cache: dict[tuple, QuantMetrics] = {}
+
+
+def clear_metrics_cache() -> None:
+    """清空量化指标缓存（基金历史数据更新后可调用以释放内存）"""
+    _metrics_cache.clear()
 
 
 def calculate_all_metrics(
     current_price: float,
-    prices_history: list[float],
-    daily_change: Optional[float] = None
+    prices_history: Union[Sequence[float], np.ndarray],
+    daily_change: Optional[float] = None,
+    use_cache: bool = True
 ) -> QuantMetrics:
     """
     计算所有量化指标（增强版）
     
     Args:
         current_price: 当前价格（预估净值）
-        prices_history: 历史价格列表（按时间降序，最新在前，建议 500+ 条）
+        prices_history: 历史价格列表或 numpy 数组（按时间降序，最新在前，建议 500+ 条）
         daily_change: 当日涨跌幅（可选）
+        use_cache: 是否使用结果缓存（同一基金重复计算时直接返回）
     
     Returns:
         QuantMetrics 包含所有指标
     """
-    if not prices_history:
+    # 各指标只依赖最近 500 个价格：一次性转换为 float64 数组（ndarray 输入为视图）
+    arr = _head(prices_history, PERCENTILE_WINDOW_LONG)
+    
+    # 缺失报价（NaN/inf）不参与计算：剔除后重新截取最近 500 个有效价格
+    if not np.isfinite(arr).all():
+        arr = np.asarray(prices_history, dtype=np.float64)
+        arr = arr[np.isfinite(arr)][:PERCENTILE_WINDOW_LONG]
+    
+    if arr.size == 0:
         return QuantMetrics(
             percentile_60=50.0,
             percentile_250=50.0,
@@ -284,25 +468,68 @@ def calculate_all_metrics(
             daily_change=daily_change
         )
     
-    # 多周期分位值计算
-    prices_60 = prices_history[:PERCENTILE_WINDOW_SHORT] if len(prices_history) > PERCENTILE_WINDOW_SHORT else prices_history
-    prices_250 = prices_history[:PERCENTILE_WINDOW_MID] if len(prices_history) > PERCENTILE_WINDOW_MID else prices_history
-    prices_500 = prices_history[:PERCENTILE_WINDOW_LONG] if len(prices_history) > PERCENTILE_WINDOW_LONG else prices_history
-    
-    max_250 = max(prices_250)
-    min_250 = min(prices_250)
-    max_60 = max(prices_60)
+    if not use_cache:
+        return _compute_metrics(current_price, arr, daily_change)
+    
+    key = (current_price, daily_change, arr.tobytes())
+    metrics = _metrics_cache.get(key)
+    if metrics is None:
+        metrics = _compute_metrics(current_price, arr, daily_change)
+        if len(_metrics_cache) >= _METRICS_CACHE_SIZE:
+            _metrics_cache.pop(next(iter(_metrics_cache)), None)
+        _metrics_cache[key] = metrics
+    return metrics
+
+
+def _compute_metrics(current_price: float, arr: np.ndarray, daily_change: Optional[float]) -> QuantMetrics:
+    """基于 float64 价格数组（非空，最近 500 个价格，由 _head 截取）计算全部量化指标"""
+    # 60 日窗口（分位/均线/波动率共用）：单次遍历同时得到均值、最值和波动率
+    ma_60, min_60, max_60, volatility_60 = map(float, _WINDOW_60_KERNEL(np.ascontiguousarray(arr[:MA_WINDOW])))
+    
+    # 250/500 日窗口为嵌套前缀，一次累计最值后按窗口末位取值（arr 已截取为最近 500 个价格）
+    n = len(arr)
+    cmin = np.minimum.accumulate(arr)
+    cmax = np.maximum.accumulate(arr)
+    last = n - 1
+    i250 = min(PERCENTILE_WINDOW_MID, n) - 1
+    
+    min_250, max_250 = float(cmin[i250]), float(cmax[i250])
+    min_500, max_500 = float(cmin[last]), float(cmax[last])
+    
+    return _build_metrics(
+        current_price, daily_change,
+        (min_60, max_60, min_250, max_250, min_500, max_500),
+        ma_60,
+        volatility_60
+    )
+
+
+def _build_metrics(
+    current_price: float,
+    daily_change: Optional[float],
+    extrema: tuple[float, float, float, float, float, float],
+    ma_60: float,
+    volatility_60: float
+) -> QuantMetrics:
+    """
+    由窗口极值、均线和波动率组装 QuantMetrics
     
-    # 均线
-    ma_60 = calculate_ma(prices_history, MA_WINDOW)
+    Args:
+        current_price: 当前价格（预估净值）
+        daily_change: 当日涨跌幅
+        extrema: (60日最低, 60日最高, 250日最低, 250日最高, 500日最低, 500日最高)
+        ma_60: 60日均线
+        volatility_60: 60日年化波动率 (%)
     
-    # 波动率
-    volatility_60 = calculate_volatility(prices_history, 60)
+    Returns:
+        QuantMetrics 包含所有指标
+    """
+    min_60, max_60, min_250, max_250, min_500, max_500 = extrema
     
     return QuantMetrics(
-        percentile_60=calculate_percentile(current_price, prices_60),
-        percentile_250=calculate_percentile(current_price, prices_250),
-        percentile_500=calculate_percentile(current_price, prices_500),
+        percentile_60=_percentile_in_range(current_price, min_60, max_60),
+        percentile_250=_percentile_in_range(current_price, min_250, max_250),
+        percentile_500=_percentile_in_range(current_price, min_500, max_500),
         ma_60=ma_60,
         ma_deviation=calculate_ma_deviation(current_price, ma_60),
         max_250=max_250,
@@ -314,6 +541,267 @@ def calculate_all_metrics(
     )
 
 
+_ROLLING_WINDOWS = (PERCENTILE_WINDOW_SHORT, PERCENTILE_WINDOW_MID, PERCENTILE_WINDOW_LONG)
+
+
+@dataclass
+class RollingMetricsState:
+    """
+    增量计算量化指标的滚动状态
+    
+    每个分位窗口维护一对单调队列（元素为 (序号, 价格)），队首即窗口最低/最高价，
+    新价格入队时弹出队尾被支配的元素、队首过期时出队，均摊 O(1)；
+    均线使用 60 日滚动求和
+    """
+    prices: deque = field(default_factory=lambda: deque(maxlen=PERCENTILE_WINDOW_LONG))  # 最近价格（按时间升序，最新在右）
+    count: int = 0                  # 已推入的价格总数（即下一个价格的序号）
+    ma_sum: float = 0.0             # 最近 MA_WINDOW 个价格之和
+    min_queues: tuple[deque, ...] = field(default_factory=lambda: tuple(deque() for _ in _ROLLING_WINDOWS))
+    max_queues: tuple[deque, ...] = field(default_factory=lambda: tuple(deque() for _ in _ROLLING_WINDOWS))
+    
+    @classmethod
+    def from_history(cls, prices_history: Union[Sequence[float], np.ndarray]) -> "RollingMetricsState":
+        """
+        由历史价格（按时间降序，最新在前）冷启动构建滚动状态
+        
+        Args:
+            prices_history: 历史价格列表或 numpy 数组
+        
+        Returns:
+            RollingMetricsState 滚动状态
+        """
+        # 与 calculate_all_metrics 一致：先剔除缺失报价，再取最近 500 个有效价格
+        prices = np.asarray(prices_history, dtype=np.float64)
+        prices = prices[np.isfinite(prices)][:PERCENTILE_WINDOW_LONG]
+        
+        state = cls()
+        for price in reversed(prices.tolist()):
+            state.push(price)
+        return state
+    
+    def push(self, price: float) -> None:
+        """
+        推入一个新的收盘价格（比已有价格都新）
+        
+        Args:
+            price: 新价格（NaN/inf 视为缺失报价，忽略）
+        """
+        if not math.isfinite(price):
+            return
+        
+        t = self.count
+        
+        # 均线：移出离开 60 日窗口的价格
+        if len(self.prices) >= MA_WINDOW:
+            self.ma_sum -= self.prices[-MA_WINDOW]
+        self.ma_sum += price
+        self.prices.append(price)
+        self.count = t + 1
+        
+        for window, mins, maxs in zip(_ROLLING_WINDOWS, self.min_queues, self.max_queues):
+            while mins and mins[-1][1] >= price:
+                mins.pop()
+            mins.append((t, price))
+            if mins[0][0] <= t - window:
+                mins.popleft()
+            
+            while maxs and maxs[-1][1] <= price:
+                maxs.pop()
+            maxs.append((t, price))
+            if maxs[0][0] <= t - window:
+                maxs.popleft()
+    
+    def metrics(self, current_price: float, daily_change: Optional[float] = None) -> QuantMetrics:
+        """
+        基于当前滚动状态计算量化指标（与对同一历史调用 calculate_all_metrics 一致）
+        
+        Args:
+            current_price: 当前价格（预估净值）
+            daily_change: 当日涨跌幅（可选）
+        
+        Returns:
+            QuantMetrics 包含所有指标
+        """
+        if not self.prices:
+            return calculate_all_metrics(current_price, [], daily_change)
+        
+        extrema = []
+        for mins, maxs in zip(self.min_queues, self.max_queues):
+            extrema.append(mins[0][1])
+            extrema.append(maxs[0][1])
+        
+        ma_60 = self.ma_sum / min(len(self.prices), MA_WINDOW)
+        
+        # 波动率只依赖最近 60 个价格，直接交给波动率内核
+        recent = np.fromiter(islice(reversed(self.prices), 60), dtype=np.float64)
+        
+        return _build_metrics(current_price, daily_change, tuple(extrema), ma_60, _VOLATILITY_KERNEL(recent))
+
+
+def update_metrics(
+    state: RollingMetricsState,
+    new_price: float,
+    current_price: float,
+    daily_change: Optional[float] = None
+) -> QuantMetrics:
+    """
+    新增一个交易日价格后增量更新量化指标（日常逐日推进的热路径）
+    
+    Args:
+        state: 滚动状态（由 RollingMetricsState.from_history 冷启动，原地更新）
+        new_price: 新的收盘净值
+        current_price: 当前价格（预估净值）
+        daily_change: 当日涨跌幅（可选）
+    
+    Returns:
+        QuantMetrics 包含所有指标
+    """
+    state.push(new_price)
+    return state.metrics(current_price, daily_change)
+
+
+@dataclass
+class QuantMetricsBatch:
+    """批量量化指标（按列存储，每个字段为长度 n 的 float64 数组，读取单行时才还原为 QuantMetrics）"""
+    percentile_60: np.ndarray
+    percentile_250: np.ndarray
+    percentile_500: np.ndarray
+    ma_60: np.ndarray
+    ma_deviation: np.ndarray
+    max_250: np.ndarray
+    min_250: np.ndarray
+    drawdown: np.ndarray
+    drawdown_60: np.ndarray
+    volatility_60: np.ndarray
+    daily_change: np.ndarray      # NaN 表示无数据
+    
+    def __len__(self) -> int:
+        return len(self.percentile_250)
+    
+    def row(self, i: int) -> QuantMetrics:
+        """第 i 只基金的量化指标"""
+        daily_change = float(self.daily_change[i])
+        return QuantMetrics(
+            percentile_60=float(self.percentile_60[i]),
+            percentile_250=float(self.percentile_250[i]),
+            percentile_500=float(self.percentile_500[i]),
+            ma_60=float(self.ma_60[i]),
+            ma_deviation=float(self.ma_deviation[i]),
+            max_250=float(self.max_250[i]),
+            min_250=float(self.min_250[i]),
+            drawdown=float(self.drawdown[i]),
+            drawdown_60=float(self.drawdown_60[i]),
+            volatility_60=float(self.volatility_60[i]),
+            daily_change=None if math.isnan(daily_change) else daily_change
+        )
+
+
+def calculate_all_metrics_batch(
+    prices: np.ndarray,
+    current: np.ndarray,
+    valid_lens: Optional[np.ndarray] = None,
+    daily_change: Optional[np.ndarray] = None
+) -> QuantMetricsBatch:
+    """
+    批量计算量化指标（向量化版，结果与 calculate_all_metrics 逐只计算一致）
+    
+    Args:
+        prices: 价格矩阵 (n_funds, max_history)，每行按时间降序（最新在前），不足部分填充 NaN
+        current: 各基金当前价格（预估净值），长度 n_funds
+        valid_lens: 各行有效价格数（可选，超出部分视为填充；默认统计每行有限值数量）
+        daily_change: 各基金当日涨跌幅（可选，NaN 表示无数据）
+    
+    Returns:
+        QuantMetricsBatch 批量量化指标
+    """
+    mat = np.asarray(prices, dtype=np.float64)
+    current = np.asarray(current, dtype=np.float64)
+    n, width = mat.shape
+    cols = np.arange(width)
+    if daily_change is None:
+        daily_change = np.full(n, np.nan)
+    
+    # 与 calculate_all_metrics 一致：缺失报价（NaN/inf，包括行中间的空缺）不参与计算，
+    # 将每行有效价格稳定地前移（保持时间顺序），之后的窗口掩码只需截断行尾
+    finite = np.isfinite(mat)
+    if valid_lens is not None:
+        finite &= cols < np.asarray(valid_lens)[:, None]
+    valid_lens = finite.sum(axis=1)
+    if not (finite == (cols < valid_lens[:, None])).all():
+        order = np.argsort(~finite, axis=1, kind="stable")
+        mat = np.take_along_axis(mat, order, axis=1)
+    
+    def window_extrema(window: int) -> tuple[np.ndarray, np.ndarray]:
+        mask = cols[:window] < valid_lens[:, None]
+        head = mat[:, :window]
+        lo = np.where(mask, head, np.inf).min(axis=1, initial=np.inf)
+        hi = np.where(mask, head, -np.inf).max(axis=1, initial=-np.inf)
+        return lo, hi
+    
+    def percentile(lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        span = hi - lo
+        with np.errstate(divide="ignore", invalid="ignore"):
+            p = (current - lo) / np.where(span == 0, 1.0, span) * 100
+        # 与 _clip_percentile 一致：NaN 归为 100
+        p = np.where(p < 0, 0.0, np.where(p < 100, p, 100.0))
+        return np.where(span == 0, 50.0, p)
+    
+    def drawdown(peak: np.ndarray) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.maximum(0.0, (peak - current) / np.where(peak == 0, 1.0, peak) * 100)
+        return np.where(peak == 0, 0.0, dd)
+    
+    min_60, max_60 = window_extrema(PERCENTILE_WINDOW_SHORT)
+    min_250, max_250 = window_extrema(PERCENTILE_WINDOW_MID)
+    min_500, max_500 = window_extrema(PERCENTILE_WINDOW_LONG)
+    
+    # 均线
+    ma_lens = np.minimum(valid_lens, MA_WINDOW)
+    ma_mask = cols[:MA_WINDOW] < valid_lens[:, None]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ma_60 = np.where(ma_mask, mat[:, :MA_WINDOW], 0.0).sum(axis=1) / ma_lens
+        ma_deviation = np.where(ma_60 == 0, 0.0, (current - ma_60) / np.where(ma_60 == 0, 1.0, ma_60) * 100)
+    
+    # 波动率：最近 60 个价格的相邻日收益率（较旧价格为 0 的收益率跳过）
+    head = mat[:, :60]
+    newer, older = head[:, :-1], head[:, 1:]
+    pair_mask = (cols[1:head.shape[1]] < np.minimum(valid_lens, 60)[:, None]) & (older != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(pair_mask, (newer - older) / np.where(pair_mask, older, 1.0), 0.0)
+        count = pair_mask.sum(axis=1)
+        mean = returns.sum(axis=1) / count
+        sq = np.where(pair_mask, (returns - mean[:, None]) ** 2, 0.0).sum(axis=1)
+        volatility_60 = np.where(count >= 2, np.sqrt(sq / (count - 1)) * _SQRT_250_X_100, 0.0)
+    
+    # 无历史数据：与 calculate_all_metrics 的默认值一致
+    empty = valid_lens == 0
+    percentile_60 = np.where(empty, 50.0, percentile(min_60, max_60))
+    percentile_250 = np.where(empty, 50.0, percentile(min_250, max_250))
+    percentile_500 = np.where(empty, 50.0, percentile(min_500, max_500))
+    ma_60 = np.where(empty, current, ma_60)
+    max_250 = np.where(empty, current, max_250)
+    min_250 = np.where(empty, current, min_250)
+    
+    return QuantMetricsBatch(
+        percentile_60=percentile_60,
+        percentile_250=percentile_250,
+        percentile_500=percentile_500,
+        ma_60=ma_60,
+        ma_deviation=np.where(empty, 0.0, ma_deviation),
+        max_250=max_250,
+        min_250=min_250,
+        drawdown=np.where(empty, 0.0, drawdown(max_250)),
+        drawdown_60=np.where(empty, 0.0, drawdown(max_60)),
+        volatility_60=volatility_60,
+        daily_change=np.asarray(daily_change, dtype=np.float64)
+    )
+
+
+# 分位区间描述（按 20% 等分，名称与 asset_config 共用）
+_ZONE_LABELS_ARR = np.array(_ZONE_NAMES)
+_ZONE_EDGES = np.array([20.0, 40.0, 60.0, 80.0])
+
+
 def get_percentile_zone(percentile: float) -> str:
     """
     获取分位区间描述
@@ -324,16 +812,23 @@ def get_percentile_zone(percentile: float) -> str:
     Returns:
         区间描述
     """
-    if percentile < 20:
-        return "黄金坑"
-    elif percentile < 40:
-        return "低估区"
-    elif percentile < 60:
-        return "合理区"
-    elif percentile < 80:
-        return "偏高区"
-    else:
-        return "高估区"
+    # 区间编号 = 分位 // 20；范围外（含 NaN）按原判断归入首尾区间
+    if 0 <= percentile < 100:
+        return _ZONE_NAMES[int(percentile) // 20]
+    return _ZONE_NAMES[0] if percentile < 0 else _ZONE_NAMES[4]
+
+
+def get_percentile_zone_batch(percentiles: np.ndarray) -> np.ndarray:
+    """
+    批量获取分位区间描述（向量化版）
+    
+    Args:
+        percentiles: 分位值数组
+    
+    Returns:
+        区间描述数组
+    """
+    return _ZONE_LABELS_ARR[np.searchsorted(_ZONE_EDGES, percentiles, side="right")]
 
 
 def get_dynamic_ma_threshold(volatility: float) -> float:
@@ -375,3 +870,19 @@ def get_dynamic_drop_threshold(volatility: float) -> tuple[float, float]:
     severe_threshold = -max(0.40, min(8.0, daily_volatility * 2.5))
     
     return normal_threshold, severe_threshold
+
+
+def _warmup_kernels() -> None:
+    """以极小输入调用各 JIT 内核，触发编译（或加载磁盘缓存）"""
+    prices = np.ones(3, dtype=np.float64)
+    try:
+        _PERCENTILE_KERNEL(prices, 1.0)
+        _VOLATILITY_KERNEL(prices)
+        _WINDOW_60_KERNEL(prices)
+    except Exception as e:
+        logger.warning(f"指标内核预热失败: {e}")
+
+
+# 使用 @njit 内核时在后台线程预热，导入不阻塞，首次真实调用无需等待 JIT 编译
+if NUMBA_AVAILABLE and _VOLATILITY_KERNEL is _volatility_kernel:
+    threading.Thread(target=_warmup_kernels, name="indicators-jit-warmup", daemon=True).start()
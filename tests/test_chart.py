@@ -0,0 +1,179 @@
+"""
+趋势图测试
+"""
+
+import os
+import subprocess
+import sys
+import warnings
+from datetime import date, timedelta
+
+import pytest
+
+from core.config import get_config
+from visualization import chart, fast_chart
+
+pytest.importorskip("matplotlib")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestTrendChartRender:
+    """matplotlib 趋势图渲染"""
+    
+    def test_single_point_today_has_no_xlim_warning(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            png = chart.generate_trend_chart("测试基金", [(date.today(), 1.0)], 1.01, 1.0, 1.0, use_cache=False)
+        
+        assert png.startswith(b"\x89PNG")
+
+
+
+def _history(days: int = 10, end: date = date(2026, 9, 30)) -> list[tuple[date, float]]:
+    """构造按日期升序的历史净值"""
+    return [(end - timedelta(days=days - 1 - i), 1.2 + 0.01 * (i % 3)) for i in range(days)]
+
+
+@pytest.fixture
+def fast_chart_on(monkeypatch):
+    """开启 Pillow 趋势图，测试前后清空字体与 PNG 缓存"""
+    monkeypatch.setattr(get_config().chart, "fast_chart", True)
+    fast_chart._load_fonts.cache_clear()
+    chart.clear_chart_cache()
+    yield
+    fast_chart._load_fonts.cache_clear()
+    chart.clear_chart_cache()
+
+
+class TestFastChartFonts:
+    """Pillow 趋势图字体在首次绘图时加载，不可用时回退到 matplotlib"""
+    
+    def test_import_does_not_load_fast_chart(self):
+        code = "import sys, visualization.chart; sys.exit('visualization.fast_chart' in sys.modules)"
+        
+        assert subprocess.run([sys.executable, "-c", code], cwd=ROOT).returncode == 0
+    
+    def test_missing_font_falls_back_to_matplotlib(self, fast_chart_on, monkeypatch):
+        monkeypatch.setattr(fast_chart, "_CJK_FONT_PATHS", ("/nonexistent/SimHei.ttf",))
+        
+        png = chart.generate_trend_chart("测试基金", [(date(2026, 9, 30), 1.0)], 1.01, 1.0, 1.0)
+        expected = chart.generate_trend_chart("测试基金", [(date(2026, 9, 30), 1.0)], 1.01, 1.0, 1.0, use_cache=False)
+        
+        assert not fast_chart.fast_chart_available()
+        assert png == expected
+    
+    def test_fonts_loaded_once(self, fast_chart_on):
+        if not fast_chart.fast_chart_available():
+            pytest.skip("没有可用的中文 TrueType 字体")
+        
+        png = chart.generate_trend_chart("测试基金", [(date(2026, 9, 30), 1.0)], 1.01, 1.0, 1.0, use_cache=False)
+        
+        assert png.startswith(b"\x89PNG")
+        assert fast_chart._load_fonts.cache_info().misses == 1
+
+
+
+@pytest.fixture
+def render_calls(monkeypatch):
+    """清空 PNG 缓存，并统计 matplotlib / Pillow 实际渲染次数"""
+    chart.clear_chart_cache()
+    calls = []
+    
+    def counting(render):
+        def wrapper(*args):
+            calls.append(render.__name__)
+            return render(*args)
+        return wrapper
+    
+    monkeypatch.setattr(chart, "_render_trend_chart", counting(chart._render_trend_chart))
+    monkeypatch.setattr(fast_chart, "generate_trend_chart_fast", counting(fast_chart.generate_trend_chart_fast))
+    yield calls
+    chart.clear_chart_cache()
+
+
+class TestTrendChartCache:
+    """趋势图 PNG 缓存：同一天输入相同才命中"""
+    
+    def test_repeat_call_returns_cached_bytes(self, render_calls):
+        first = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        second = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        
+        assert second is first
+        assert len(render_calls) == 1
+    
+    def test_distinct_inputs_miss(self, render_calls):
+        chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, -1.5)
+        chart.generate_trend_chart("其他基金", _history(), 1.25, 1.21, 1.5)
+        
+        assert len(render_calls) == 3
+    
+    def test_date_change_misses(self, render_calls, monkeypatch):
+        first = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        
+        class Tomorrow(date):
+            @classmethod
+            def today(cls):
+                return date.today() + timedelta(days=1)
+        
+        monkeypatch.setattr(chart, "date", Tomorrow)
+        second = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        
+        assert len(render_calls) == 2
+        assert second != first
+    
+    def test_fast_flag_change_misses(self, render_calls, fast_chart_on, monkeypatch):
+        if not fast_chart.fast_chart_available():
+            pytest.skip("没有可用的中文 TrueType 字体")
+        
+        fast = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        monkeypatch.setattr(get_config().chart, "fast_chart", False)
+        slow = chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.5)
+        
+        assert render_calls == ["generate_trend_chart_fast", "_render_trend_chart"]
+        assert slow != fast
+    
+    def test_cache_size_is_bounded(self, render_calls, monkeypatch):
+        monkeypatch.setattr(chart, "_CHART_CACHE_SIZE", 2)
+        
+        for change in (1.0, 2.0, 3.0):
+            chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, change)
+        chart.generate_trend_chart("测试基金", _history(), 1.25, 1.21, 1.0)
+        
+        assert len(chart._chart_cache) == 2
+        assert len(render_calls) == 4
+
+
+@pytest.fixture
+def chart_pool(monkeypatch):
+    """使用独立的批量渲染进程池，测试结束后关闭"""
+    monkeypatch.setattr(chart, "_pool", None)
+    yield
+    if chart._pool is not None:
+        chart._pool.shutdown()
+
+
+class TestTrendChartBatch:
+    """批量渲染与逐张渲染结果一致"""
+    
+    def test_batch_matches_sequential(self, chart_pool):
+        requests = [
+            ("沪深300ETF联接", _history(), 1.25, 1.21, 1.5),
+            ("黄金ETF", _history(), 1.15, 1.22, -2.3),
+            ("债基", _history(5), 1.2, 1.2),
+            ("单点", _history(1), 1.21, 1.2, 0.8),
+            ("沪深300ETF联接", _history(), 1.25, 1.21, 1.5),
+        ]
+        
+        expected = [chart.generate_trend_chart(*args, use_cache=False) for args in requests]
+        actual = chart.generate_trend_charts_batch(requests)
+        
+        assert chart._pool is not None
+        assert actual == expected
+    
+    def test_single_request_renders_in_process(self, chart_pool):
+        requests = [("沪深300ETF联接", _history(), 1.25, 1.21, 1.5)]
+        
+        assert chart.generate_trend_charts_batch(requests) == [chart.generate_trend_chart(*requests[0])]
+        assert chart._pool is None
@@ -0,0 +1,42 @@
+"""
+决策合成测试
+"""
+
+import pytest
+
+from strategy.etf_strategy import Decision, StrategyResult, Zone
+
+synthesizer = pytest.importorskip("strategy.decision_synthesizer")
+ai_decision = pytest.importorskip("ai.ai_decision")
+
+
+def _strategy(decision: Decision, confidence: float = 0.6) -> StrategyResult:
+    return StrategyResult(decision=decision, confidence=confidence, reason_template="测试", zone=Zone.FAIR)
+
+
+def _ai(decision: str, confidence: str = "高") -> "ai_decision.AIDecisionResult":
+    return ai_decision.AIDecisionResult(
+        decision=decision, confidence=confidence, reasoning="测试", asset_class="GOLD_ETF"
+    )
+
+
+class TestUnknownAIDecision:
+    """无法识别的 AI 决策不能被当作观望"""
+    
+    def test_unknown_is_not_consistent_with_hold(self):
+        result = synthesizer.synthesize_decisions(_strategy(Decision.HOLD), _ai("加仓"), "GOLD_ETF")
+        
+        assert result.is_consistent is False
+        assert result.final_decision == Decision.HOLD.value
+    
+    def test_unknown_is_never_adopted(self):
+        for decision in Decision:
+            result = synthesizer.synthesize_decisions(_strategy(decision, 0.1), _ai("加仓"), "GOLD_ETF")
+            
+            assert result.is_consistent is False
+            assert result.final_decision in {d.value for d in Decision}
+    
+    def test_known_hold_is_consistent(self):
+        result = synthesizer.synthesize_decisions(_strategy(Decision.HOLD), _ai(Decision.HOLD.value), "GOLD_ETF")
+        
+        assert result.is_consistent is True
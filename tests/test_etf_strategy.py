@@ -0,0 +1,108 @@
+"""
+ETF 策略测试
+"""
+
+import math
+
+import pytest
+
+from strategy import etf_strategy
+from strategy.asset_config import get_thresholds, get_zone_name
+from strategy.etf_strategy import Decision, evaluate_etf_strategy, evaluate_etf_strategy_batch
+from strategy.indicators import QuantMetrics
+
+
+def _make_metrics(percentile_250: float, percentile_60: float = 50.0, percentile_500: float = 50.0) -> QuantMetrics:
+    """构造量化指标（均线、回撤等取中性值）"""
+    return QuantMetrics(
+        percentile_60=percentile_60,
+        percentile_250=percentile_250,
+        percentile_500=percentile_500,
+        ma_60=1.0,
+        ma_deviation=1.0,
+        max_250=1.2,
+        min_250=0.8,
+        drawdown=-5.0,
+        drawdown_60=-2.0,
+        volatility_60=10.0,
+        daily_change=None
+    )
+
+
+class TestScalarBatchParity:
+    """逐只评估与批量评估对同一输入给出相同结果"""
+    
+    @pytest.mark.parametrize("asset_class", ["GOLD_ETF", "COMMODITY_CYCLE", "DEFAULT_ETF"])
+    @pytest.mark.parametrize("percentile", [math.nan, 0.0, 15.0, 35.0, 50.0, 65.0, 85.0, 100.0])
+    def test_zone_and_decision_match(self, asset_class, percentile):
+        metrics = _make_metrics(percentile)
+        
+        scalar = evaluate_etf_strategy(metrics, asset_class, memoize=False)
+        batch = evaluate_etf_strategy_batch([metrics], [asset_class])
+        
+        assert scalar.zone == batch.zone(0)
+        assert scalar.decision == batch.decision(0)
+        assert scalar.confidence == pytest.approx(float(batch.confidence[0]))
+    
+    def test_nan_percentile_is_top_zone(self):
+        thresholds = get_thresholds("GOLD_ETF")
+        result = evaluate_etf_strategy(_make_metrics(math.nan), "GOLD_ETF", memoize=False)
+        
+        # 与 asset_config.get_zone_name 一致：NaN 归入最高区间，不能触发黄金坑的双倍补仓
+        assert result.zone.label == get_zone_name(math.nan, thresholds)
+        assert result.decision != Decision.DOUBLE_BUY
+
+
+
+@pytest.fixture
+def kernel_calls(monkeypatch):
+    """清空决策内核缓存，并统计实际调用内核的次数"""
+    monkeypatch.setattr(etf_strategy, "_kernel_cache", [None] * etf_strategy._KERNEL_CACHE_SIZE)
+    calls = []
+    decide_core = etf_strategy.decide_core
+    
+    def counting_decide_core(*args):
+        calls.append(args)
+        return decide_core(*args)
+    
+    monkeypatch.setattr(etf_strategy, "decide_core", counting_decide_core)
+    return calls
+
+
+class TestKernelCache:
+    """决策内核缓存：按完整输入命中，不同输入互不串用"""
+    
+    def test_repeat_input_hits_cache(self, kernel_calls):
+        metrics = _make_metrics(15.0)
+        
+        first = evaluate_etf_strategy(metrics, "GOLD_ETF")
+        second = evaluate_etf_strategy(metrics, "GOLD_ETF")
+        
+        assert len(kernel_calls) == 1
+        assert second == first
+    
+    @pytest.mark.parametrize("cache_size", [1, 512])
+    def test_distinct_inputs_do_not_collide(self, kernel_calls, monkeypatch, cache_size):
+        # 容量为 1 时所有输入落在同一槽位，只能靠完整键比较区分
+        monkeypatch.setattr(etf_strategy, "_KERNEL_CACHE_SIZE", cache_size)
+        # 分位相同、资产类型不同的输入相邻出现，且落在各资产阈值不同的位置
+        cases = [
+            (_make_metrics(percentile), asset_class)
+            for percentile in [15.0, 30.0, 35.0, 60.0, 65.0, 80.0, 85.0, 90.0]
+            for asset_class in ["GOLD_ETF", "COMMODITY_CYCLE", "DEFAULT_ETF"]
+        ]
+        
+        for _ in range(2):
+            for metrics, asset_class in cases:
+                expected = evaluate_etf_strategy(metrics, asset_class, memoize=False)
+                actual = evaluate_etf_strategy(metrics, asset_class)
+                
+                assert (actual.zone, actual.decision, actual.confidence) == \
+                    (expected.zone, expected.decision, expected.confidence)
+    
+    def test_cache_size_is_bounded(self, kernel_calls):
+        for i in range(3 * etf_strategy._KERNEL_CACHE_SIZE):
+            evaluate_etf_strategy(_make_metrics(i / 20), "DEFAULT_ETF")
+        
+        assert len(etf_strategy._kernel_cache) == etf_strategy._KERNEL_CACHE_SIZE
+        assert len(kernel_calls) == 3 * etf_strategy._KERNEL_CACHE_SIZE
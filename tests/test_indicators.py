@@ -0,0 +1,214 @@
+"""
+量化指标测试
+"""
+
+import math
+from dataclasses import asdict
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from strategy import indicators
+from strategy.asset_config import get_thresholds, get_zone_name
+from strategy.indicators import (
+    RollingMetricsState,
+    calculate_all_metrics,
+    calculate_all_metrics_batch,
+    clear_metrics_cache,
+    update_metrics
+)
+
+
+def _boundary_history() -> tuple[list[float], float]:
+    """构造 500 日净值（4 位小数）及使 250 日分位恰好落在 65% 阈值上的当前价格"""
+    history = [round(1.2345 + 0.0001 * ((i * 37) % 2223), 4) for i in range(500)]
+    lo, hi = min(history[:250]), max(history[:250])
+    return history, lo + 0.65 * (hi - lo)
+
+
+class TestNavPrecision:
+    """净值数组精度：阈值边界上的分位值不能因数组类型改变区间"""
+    
+    def test_boundary_zone_matches_list_input(self):
+        history, current = _boundary_history()
+        thresholds = get_thresholds("GOLD_ETF")
+        
+        expected = calculate_all_metrics(current, history, use_cache=False).percentile_250
+        actual = calculate_all_metrics(current, np.asarray(history, dtype=np.float64), use_cache=False).percentile_250
+        
+        assert expected >= 65.0
+        assert actual == expected
+        assert get_zone_name(actual, thresholds) == get_zone_name(expected, thresholds)
+    
+    def test_nav_array_keeps_boundary_zone(self):
+        fund_history = pytest.importorskip("data.fund_history")
+        history, current = _boundary_history()
+        thresholds = get_thresholds("GOLD_ETF")
+        nav_history = [(date(2026, 1, 1) - timedelta(days=i), nav) for i, nav in enumerate(history)]
+        
+        arr = fund_history.nav_array(nav_history)
+        expected = calculate_all_metrics(current, history, use_cache=False).percentile_250
+        actual = calculate_all_metrics(current, arr, use_cache=False).percentile_250
+        
+        assert arr.dtype == np.float64
+        assert actual == expected
+        assert get_zone_name(actual, thresholds) == get_zone_name(expected, thresholds)
+
+
+def _assert_metrics_close(actual, expected):
+    """逐字段比较两个 QuantMetrics（浮点按相对误差比较）"""
+    for name, value in asdict(expected).items():
+        if value is None:
+            assert getattr(actual, name) is None, name
+        else:
+            assert getattr(actual, name) == pytest.approx(value, rel=1e-9, abs=1e-9), name
+
+
+class TestBatchParity:
+    """批量计算与逐只计算一致：缺失报价（含行中间空缺与 inf）均被剔除"""
+    
+    def test_gaps_and_inf_match_scalar(self):
+        rng = np.random.default_rng(7)
+        rows = [
+            [1.0, 1.1, np.nan, 1.3, 0.9],
+            [1.0, np.inf, 1.2, np.nan, 0.8, 1.05],
+            [-np.inf, np.nan, 1.1],
+            [np.nan, np.nan],
+            list(1 + 0.1 * rng.standard_normal(600)),
+        ]
+        rows[4][3] = np.nan
+        rows[4][100] = np.inf
+        rows[4][300] = np.nan
+        current = np.array([1.05, 1.0, 1.2, 1.0, 1.02])
+        
+        width = max(map(len, rows))
+        mat = np.full((len(rows), width), np.nan)
+        for i, row in enumerate(rows):
+            mat[i, :len(row)] = row
+        
+        batch = calculate_all_metrics_batch(mat, current)
+        for i, row in enumerate(rows):
+            _assert_metrics_close(batch.row(i), calculate_all_metrics(current[i], row, use_cache=False))
+        
+        assert batch.percentile_250[0] == pytest.approx(37.5)
+    
+    def test_valid_lens_ignores_padding(self):
+        mat = np.array([[1.0, np.nan, 1.2, 9.0, 9.0]])
+        
+        batch = calculate_all_metrics_batch(mat, np.array([1.1]), valid_lens=np.array([3]))
+        
+        _assert_metrics_close(batch.row(0), calculate_all_metrics(1.1, [1.0, 1.2], use_cache=False))
+    
+    def test_ragged_histories_match_scalar(self):
+        rng = np.random.default_rng(5)
+        lengths = [0, 1, 2, 59, 60, 61, 249, 250, 499, 500, 650]
+        current = 1 + 0.1 * rng.standard_normal(len(lengths))
+        daily_change = np.where(np.arange(len(lengths)) % 2 == 0, np.nan, 0.8)
+        
+        mat = np.full((len(lengths), max(lengths)), np.nan)
+        for i, length in enumerate(lengths):
+            mat[i, :length] = 1 + 0.1 * rng.standard_normal(length)
+        
+        batch = calculate_all_metrics_batch(mat, current, daily_change=daily_change)
+        
+        assert len(batch) == len(lengths)
+        for i, length in enumerate(lengths):
+            change = None if np.isnan(daily_change[i]) else float(daily_change[i])
+            expected = calculate_all_metrics(float(current[i]), mat[i, :length], change, use_cache=False)
+            _assert_metrics_close(batch.row(i), expected)
+
+
+class TestRollingMetrics:
+    """增量更新与对同一历史全量计算一致"""
+    
+    def test_update_matches_full_recompute(self):
+        rng = np.random.default_rng(11)
+        # 先跌后涨再跌：早期最低/最高价会随窗口滑动从单调队列中过期
+        trend = np.concatenate([np.linspace(2.0, 1.0, 300), np.linspace(1.0, 3.0, 400), np.linspace(3.0, 1.5, 300)])
+        prices = (trend + 0.02 * rng.standard_normal(trend.size)).tolist()
+        prices[650] = float("nan")
+        prices[820] = float("inf")
+        
+        state = RollingMetricsState.from_history(prices[:100][::-1])
+        history = prices[:100][::-1]
+        for i, price in enumerate(prices[100:], start=100):
+            history.insert(0, price)
+            current = price * 1.01 if math.isfinite(price) else 2.0
+            
+            actual = update_metrics(state, price, current, daily_change=0.5)
+            
+            if i % 7 == 0 or i in (650, 651, 820, 821) or i > 990:
+                _assert_metrics_close(actual, calculate_all_metrics(current, history, 0.5, use_cache=False))
+        
+        assert state.count == len(prices) - 2
+        assert len(state.prices) == 500
+    
+    def test_from_history_matches_full_recompute(self):
+        history = [1.0 + 0.001 * ((i * 53) % 311) for i in range(700)]
+        history[10] = float("nan")
+        
+        actual = RollingMetricsState.from_history(history).metrics(1.1)
+        
+        _assert_metrics_close(actual, calculate_all_metrics(1.1, history, use_cache=False))
+    
+    def test_nan_price_is_ignored(self):
+        state = RollingMetricsState.from_history([1.2, 1.1, 1.0])
+        before = state.metrics(1.15)
+        
+        after = update_metrics(state, float("nan"), 1.15)
+        
+        assert state.count == 3
+        assert after == before
+
+
+
+@pytest.fixture
+def metrics_cache():
+    """测试前后清空量化指标缓存"""
+    clear_metrics_cache()
+    yield indicators._metrics_cache
+    clear_metrics_cache()
+
+
+class TestMetricsCache:
+    """量化指标缓存：内容完全相同才命中，容量有上限"""
+    
+    def test_repeat_input_hits_cache(self, metrics_cache):
+        history = [1.0 + 0.01 * (i % 17) for i in range(300)]
+        
+        first = calculate_all_metrics(1.05, history)
+        second = calculate_all_metrics(1.05, np.asarray(history))
+        
+        assert second is first
+        assert len(metrics_cache) == 1
+    
+    def test_distinct_inputs_do_not_collide(self, metrics_cache):
+        history = [1.0 + 0.01 * (i % 17) for i in range(300)]
+        other = list(history)
+        other[299] = 0.5
+        cases = [(1.05, history, None), (1.10, history, None), (1.05, history, 0.3), (1.05, other, None)]
+        
+        for _ in range(2):
+            for current, prices, change in cases:
+                assert calculate_all_metrics(current, prices, change) == \
+                    calculate_all_metrics(current, prices, change, use_cache=False)
+        
+        assert len(metrics_cache) == len(cases)
+    
+    def test_clear_resets_cache(self, metrics_cache):
+        first = calculate_all_metrics(1.05, [1.0, 1.1])
+        clear_metrics_cache()
+        
+        assert len(metrics_cache) == 0
+        assert calculate_all_metrics(1.05, [1.0, 1.1]) is not first
+    
+    def test_cache_size_is_bounded(self, metrics_cache, monkeypatch):
+        monkeypatch.setattr(indicators, "_METRICS_CACHE_SIZE", 4)
+        
+        for i in range(10):
+            calculate_all_metrics(1.0 + i / 100, [1.0, 1.1])
+        
+        assert len(metrics_cache) == 4
+        # 超出容量时淘汰最早写入的条目
+        assert [key[0] for key in metrics_cache] == [1.06, 1.07, 1.08, 1.09]
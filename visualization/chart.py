@@ -4,50 +4,128 @@ FundPilot-AI 可视化模块
 """
 
 import io
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import date
-from typing import Optional
-
-import matplotlib
-matplotlib.use('Agg')  # 无窗口模式
+from typing import TYPE_CHECKING, Optional
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.font_manager import FontProperties
+import numpy as np
+from PIL import Image
 
+from core.config import get_config
 from core.logger import get_logger
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.collections import LineCollection, PathCollection
+    from matplotlib.figure import Figure
+    from matplotlib.legend import Legend
+    from matplotlib.text import Text
+
 logger = get_logger("chart")
 
-import os
+# matplotlib 模块引用（延迟加载，首次绘图时由 _lazy_mpl 导入并完成字体配置）
+plt = None
+mdates = None
+_Figure = None
+_FigureCanvasAgg = None
+_MPL_LOCK = threading.Lock()
+
+# 中文字体候选路径：优先使用项目内置字体，其次为各平台系统字体
+# 内置字体请从 https://github.com/StellarCN/scp_zh/raw/master/fonts/SimHei.ttf 下载并放入 data/fonts 目录
+_CJK_FONT_PATHS = (
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "fonts", "SimHei.ttf"),
+    '/System/Library/Fonts/PingFang.ttc',                       # macOS
+    'C:/Windows/Fonts/msyh.ttc', 'C:/Windows/Fonts/simhei.ttf',  # Windows
+    '/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc',   # Linux
+    '/usr/share/fonts/truetype/wqy/wqy-microhei.ttc',
+)
+
+# 中文字体（_lazy_mpl 首次调用时加载，未找到字体时为 None，使用 matplotlib 默认字体）
+_cjk_font = None
+
+
+def _setup_fonts(pyplot) -> None:
+    """
+    加载中文字体，构造一次 FontProperties 供所有文字调用直接使用
+    
+    按 _CJK_FONT_PATHS 顺序取第一个存在的字体文件；同时设为默认字体族，
+    覆盖刻度标签等未显式指定字体的文字
+    
+    Args:
+        pyplot: matplotlib.pyplot 模块
+    """
+    global _cjk_font
+    from matplotlib import font_manager
+    from matplotlib.font_manager import FontProperties
+    
+    pyplot.rcParams['axes.unicode_minus'] = False
+    
+    for font_path in _CJK_FONT_PATHS:
+        if not os.path.exists(font_path):
+            continue
+        try:
+            # 注册字体，使默认字体族能够按名称匹配
+            font_manager.fontManager.addfont(font_path)
+            _cjk_font = FontProperties(fname=font_path)
+            pyplot.rcParams['font.family'] = _cjk_font.get_name()
+            logger.info(f"使用中文字体: {font_path}")
+            return
+        except Exception as e:
+            logger.warning(f"字体加载失败 {font_path}: {e}")
+    
+    logger.warning("未找到中文字体，图表中文可能无法正常显示")
+
+
+def _font(size: float):
+    """
+    获取指定字号的中文字体（用于不接受 fontsize 覆盖的 prop 参数，如图例）
+    
+    Args:
+        size: 字号
+    
+    Returns:
+        FontProperties
+    """
+    from matplotlib.font_manager import FontProperties
+    
+    prop = _cjk_font.copy() if _cjk_font is not None else FontProperties()
+    prop.set_size(size)
+    return prop
+
+
+def _lazy_mpl() -> None:
+    """
+    首次调用时导入 matplotlib 并配置字体，之后直接返回
+    
+    导入 visualization.chart 本身不加载 matplotlib，不绘图的进程无需承担其后端初始化与字体扫描开销
+    """
+    global plt, mdates, _Figure, _FigureCanvasAgg
+    if plt is not None:
+        return
+    
+    with _MPL_LOCK:
+        if plt is not None:
+            return
+        
+        import matplotlib
+        matplotlib.use('Agg')  # 无窗口模式
+        
+        import matplotlib.dates as _mdates
+        import matplotlib.pyplot as _plt
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
+        mdates = _mdates
+        _Figure = Figure
+        _FigureCanvasAgg = FigureCanvasAgg
+        _setup_fonts(_plt)
+        plt = _plt
 
-# 字体配置
-try:
-    # 1. 优先使用项目内置字体 (data/fonts/SimHei.ttf)
-    # 请从 https://github.com/StellarCN/scp_zh/raw/master/fonts/SimHei.ttf 下载并放入该目录
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    font_path = os.path.join(project_root, "data", "fonts", "SimHei.ttf")
-    
-    if os.path.exists(font_path):
-        font_prop = FontProperties(fname=font_path)
-        plt.rcParams['font.family'] = font_prop.get_name()
-        # 注册字体以确保生效
-        from matplotlib import font_manager
-        font_manager.fontManager.addfont(font_path)
-        logger.info(f"使用内置字体: {font_path}")
-    else:
-        # 2. 回退到系统字体列表
-        font_list = [
-            'Arial Unicode MS', 'PingFang SC', 'Heiti SC',  # macOS
-            'Microsoft YaHei', 'SimHei',                    # Windows
-            'WenQuanYi Micro Hei', 'Droid Sans Fallback',   # Linux
-            'Noto Sans CJK SC'
-        ]
-        plt.rcParams['font.sans-serif'] = font_list + plt.rcParams['font.sans-serif']
-        logger.info("使用系统字体列表匹配")
-except Exception as e:
-    logger.warning(f"字体配置失败: {e}")
-
-plt.rcParams['axes.unicode_minus'] = False
 
 # 颜色配置
 COLOR_UP = '#e74c3c'       # 涨 - 红色
@@ -55,23 +133,179 @@ COLOR_DOWN = '#27ae60'     # 跌 - 绿色
 COLOR_MA60 = '#3498db'     # MA60 - 蓝色
 COLOR_GRID = '#ecf0f1'     # 网格线
 
+# 趋势图 PNG 缓存：键为全部绘图输入（含当天日期），超出容量时淘汰最久未使用的条目
+_CHART_CACHE_SIZE = 128
+_chart_cache: OrderedDict[tuple, bytes] = OrderedDict()
+_chart_cache_lock = threading.Lock()
+
+# 批量渲染进程池（延迟创建，每个工作进程各自复用缓存的 Figure）
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# 图表复用缓存：每个线程按 (figsize, dpi) 保存一组 (Figure, Axes)，每次绘图前清空 Axes；
+# 趋势图另外保存一组常驻图元（_TrendArtists），不清空 Axes
+_FIG_CACHE = threading.local()
+
+# 固定边距（按 tight_layout 的结果取值，预留旋转的日期标签与今日预估标注的空间）
+_TREND_MARGINS = {'left': 0.08, 'right': 0.95, 'bottom': 0.16, 'top': 0.89}
+_SIMPLE_MARGINS = {'left': 0.08, 'right': 0.98, 'bottom': 0.10, 'top': 0.90}
+
+
+def _get_cached_axes(
+    figsize: tuple[float, float],
+    dpi: int,
+    margins: dict[str, float],
+    x_label_rotation: float = 0
+) -> tuple['Figure', 'Axes']:
+    """
+    获取当前线程缓存的 (Figure, Axes)，首次调用时创建
+    
+    直接创建 Figure + Agg 画布而不经过 pyplot，缓存的图表不进入 pyplot 全局图表管理；
+    边距与 X 轴标签旋转只在创建时设置一次（ax.clear() 不会重置），绘图时不再调用 tight_layout
+    
+    Args:
+        figsize: 图表尺寸（英寸）
+        dpi: 分辨率
+        margins: 固定边距（subplots_adjust 参数，相对图表尺寸的比例）
+        x_label_rotation: X 轴刻度标签旋转角度
+    
+    Returns:
+        (Figure, Axes)，Axes 已清空
+    """
+    cache = getattr(_FIG_CACHE, "figures", None)
+    if cache is None:
+        cache = _FIG_CACHE.figures = {}
+    
+    key = (figsize, dpi)
+    if key not in cache:
+        fig = _Figure(figsize=figsize, dpi=dpi, facecolor='white')
+        _FigureCanvasAgg(fig)
+        fig.subplots_adjust(**margins)
+        ax = fig.add_subplot()
+        ax.tick_params(axis='x', labelrotation=x_label_rotation)
+        cache[key] = (fig, ax)
+    
+    fig, ax = cache[key]
+    ax.clear()
+    return fig, ax
+
+
+def _render_png(fig: 'Figure') -> bytes:
+    """
+    渲染图表并编码为 PNG
+    
+    只绘制一次（不使用 bbox_inches='tight' 的二次测量渲染），
+    直接读取 Agg 的 RGBA 缓冲区，由 Pillow 以低压缩级别编码
+    
+    Args:
+        fig: 图表
+    
+    Returns:
+        PNG 图片字节流
+    """
+    fig.canvas.draw()
+    width, height = fig.canvas.get_width_height()
+    img = Image.frombuffer('RGBA', (width, height), fig.canvas.buffer_rgba(), 'raw', 'RGBA', 0, 1)
+    
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', compress_level=1)
+    return buf.getvalue()
+
+
+@dataclass(slots=True)
+class _TrendArtists:
+    """趋势图的常驻图元：每个线程创建一次，之后每次绘图只更新数据、文字与颜色"""
+    fig: 'Figure'
+    ax: 'Axes'
+    lines: 'LineCollection'     # 历史净值 + 今日预估 + MA60 参考线
+    points: 'PathCollection'    # 数据点
+    value_text: 'Text'          # 今日预估值标注
+    legend: 'Legend'
+
+
+def _get_trend_artists() -> _TrendArtists:
+    """
+    获取当前线程的趋势图常驻图元，首次调用时创建图表并完成静态配置
+    
+    标题、坐标轴标签、日期格式、网格和图例只在创建时设置一次；
+    该图表不再调用 ax.clear()，标注、标题和图例文字均复用已有图元
+    
+    Returns:
+        _TrendArtists
+    """
+    artists = getattr(_FIG_CACHE, "trend", None)
+    if artists is not None:
+        return artists
+    
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+    from matplotlib.transforms import offset_copy
+    
+    fig, ax = _get_cached_axes((10, 5), 100, _TREND_MARGINS, x_label_rotation=45)
+    
+    lines = ax.add_collection(LineCollection([]), autolim=False)
+    points = ax.scatter([], [], zorder=2.5)
+    
+    # 标注今日预估值（无箭头，使用偏移 10pt 的文字）
+    value_text = ax.text(0, 0, '',
+                         transform=offset_copy(ax.transData, fig=fig, x=10, y=10, units='points'),
+                         fontproperties=_cjk_font,
+                         fontsize=10,
+                         fontweight='bold')
+    
+    ax.set_title('', fontproperties=_cjk_font, fontsize=14, fontweight='bold', pad=15)
+    
+    # 设置坐标轴
+    ax.set_xlabel('日期', fontproperties=_cjk_font, fontsize=10)
+    ax.set_ylabel('净值', fontproperties=_cjk_font, fontsize=10)
+    
+    # 日期格式（X 轴数据为浮点序数，需声明为日期轴）
+    ax.xaxis_date()
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
+    ax.xaxis.set_major_locator(mdates.DayLocator(interval=2))
+    
+    # 网格
+    ax.grid(True, linestyle='--', alpha=0.3, color=COLOR_GRID)
+    ax.set_axisbelow(True)
+    
+    # 图例：线段合并为 LineCollection 后没有逐条线的 label，使用代理图例句柄，标签文字每次绘图时更新
+    handles = [
+        Line2D([], [], color='#2c3e50', linewidth=2, marker='o', markersize=5),
+        Line2D([], [], color=COLOR_UP, linewidth=2, linestyle='--', marker='o', markersize=8),
+        Line2D([], [], color=COLOR_MA60, linewidth=1.5, linestyle='-.'),
+    ]
+    legend = ax.legend(handles, ['', '', ''], loc='upper left', prop=_font(9))
+    
+    artists = _FIG_CACHE.trend = _TrendArtists(fig, ax, lines, points, value_text, legend)
+    return artists
+
+
+def clear_chart_cache() -> None:
+    """清空趋势图 PNG 缓存"""
+    with _chart_cache_lock:
+        _chart_cache.clear()
+
 
 def generate_trend_chart(
     fund_name: str,
     history_10d: list[tuple[date, float]],
     estimate_today: float,
     ma_60: float,
-    estimate_change: Optional[float] = None
+    estimate_change: Optional[float] = None,
+    use_cache: bool = True
 ) -> bytes:
     """
     生成 "10+1" 趋势图
     
+    配置 FUND_PILOT_FAST_CHART=true（core.config 的 chart.fast_chart）时改用 Pillow 直接绘制（见 visualization.fast_chart）
+    
     Args:
         fund_name: 基金名称
         history_10d: 前 10 个交易日净值 [(日期, 净值), ...]（按日期升序）
         estimate_today: 今日预估净值
         ma_60: 60日均线
         estimate_change: 预估涨跌幅
+        use_cache: 是否使用 PNG 缓存（同一天内输入相同时直接返回已渲染的图片）
     
     Returns:
         PNG 图片字节流
@@ -80,13 +314,104 @@ def generate_trend_chart(
         logger.warning("没有历史数据，无法生成图表")
         return b""
     
-    # 准备数据
-    dates = [d for d, _ in history_10d]
-    navs = [nav for _, nav in history_10d]
+    # Pillow 版按需导入并在首次绘图时加载字体；中文字体不可用时回退到 matplotlib
+    fast = False
+    render = _render_trend_chart
+    if get_config().chart.fast_chart:
+        from visualization import fast_chart
+        if fast_chart.fast_chart_available():
+            fast = True
+            render = fast_chart.generate_trend_chart_fast
+    
+    if not use_cache:
+        return render(fund_name, history_10d, estimate_today, ma_60, estimate_change)
+    
+    # 今日预估点的横坐标为当天日期，键中包含日期，跨天后不会命中前一天的图片
+    key = (fund_name, tuple(history_10d), round(estimate_today, 6), round(ma_60, 6),
+           estimate_change, date.today(), fast)
+    with _chart_cache_lock:
+        png = _chart_cache.get(key)
+        if png is not None:
+            _chart_cache.move_to_end(key)
+            return png
+    
+    png = render(fund_name, history_10d, estimate_today, ma_60, estimate_change)
+    
+    with _chart_cache_lock:
+        _chart_cache[key] = png
+        if len(_chart_cache) > _CHART_CACHE_SIZE:
+            _chart_cache.popitem(last=False)
+    return png
+
+
+def _render_trend_chart(
+    fund_name: str,
+    history_10d: list[tuple[date, float]],
+    estimate_today: float,
+    ma_60: float,
+    estimate_change: Optional[float]
+) -> bytes:
+    """使用 matplotlib 渲染 "10+1" 趋势图（参数同 generate_trend_chart，history_10d 非空）"""
+    png = _render_png(_draw_trend_chart(fund_name, history_10d, estimate_today, ma_60, estimate_change))
+    
+    logger.info(f"生成趋势图: {fund_name}")
+    return png
+
+
+def generate_trend_chart_svg(
+    fund_name: str,
+    history_10d: list[tuple[date, float]],
+    estimate_today: float,
+    ma_60: float,
+    estimate_change: Optional[float] = None
+) -> bytes:
+    """
+    生成 SVG 格式的 "10+1" 趋势图
+    
+    图表只有少量线段和文字，SVG 输出无需光栅化和 PNG 压缩，体积也更小；
+    适用于可直接显示 SVG 的场景（网页、PDF），邮件等需要位图的场景仍使用 generate_trend_chart
+    
+    Args:
+        fund_name: 基金名称
+        history_10d: 前 10 个交易日净值 [(日期, 净值), ...]（按日期升序）
+        estimate_today: 今日预估净值
+        ma_60: 60日均线
+        estimate_change: 预估涨跌幅
+    
+    Returns:
+        SVG 文档字节流 (UTF-8)
+    """
+    if not history_10d:
+        logger.warning("没有历史数据，无法生成图表")
+        return b""
+    
+    fig = _draw_trend_chart(fund_name, history_10d, estimate_today, ma_60, estimate_change)
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='svg')
+    
+    logger.info(f"生成趋势图 (SVG): {fund_name}")
+    return buf.getvalue()
+
+
+def _draw_trend_chart(
+    fund_name: str,
+    history_10d: list[tuple[date, float]],
+    estimate_today: float,
+    ma_60: float,
+    estimate_change: Optional[float]
+) -> 'Figure':
+    """在缓存的图表上绘制 "10+1" 趋势图（参数同 generate_trend_chart，history_10d 非空），返回待输出的 Figure"""
+    _lazy_mpl()
+    
+    # 准备数据：日期一次性转换为 matplotlib 浮点序数，避免绘图时逐点转换
+    dates, navs = zip(*history_10d)
+    xs = mdates.date2num(dates)
+    navs = np.fromiter(navs, dtype=np.float64, count=len(navs))
     
     # 今日数据
-    today = date.today()
-    last_nav = navs[-1]
+    today_num = mdates.date2num(date.today())
+    last_nav = float(navs[-1])
     
     # 判断涨跌颜色
     if estimate_today >= last_nav:
@@ -96,82 +421,69 @@ def generate_trend_chart(
         today_color = COLOR_DOWN
         line_style = '--'
     
-    # 创建图表
-    fig, ax = plt.subplots(figsize=(10, 5), dpi=100)
-    
-    # 绘制历史净值（实线）
-    ax.plot(dates, navs, 
-            color='#2c3e50', 
-            linewidth=2, 
-            marker='o', 
-            markersize=5,
-            label='历史净值')
-    
-    # 绘制今日预估（虚线）
-    ax.plot([dates[-1], today], [last_nav, estimate_today],
-            color=today_color,
-            linewidth=2,
-            linestyle=line_style,
-            marker='o',
-            markersize=8,
-            label=f'今日预估 ({estimate_change:+.2f}%)' if estimate_change else '今日预估')
-    
-    # 绘制 MA60 参考线
-    ax.axhline(y=ma_60, 
-               color=COLOR_MA60, 
-               linestyle='-.', 
-               linewidth=1.5,
-               label=f'MA60 ({ma_60:.4f})')
+    artists = _get_trend_artists()
+    fig, ax = artists.fig, artists.ax
+    
+    # X 轴范围：两端各留 5%（与 matplotlib 默认 margins 一致），MA60 参考线横跨整个范围；
+    # 唯一的历史点即为当天时跨度为 0，两端各留 1 天，避免 set_xlim 上下限相同
+    x_pad = (today_num - xs[0]) * 0.05 or 1.0
+    x_left, x_right = xs[0] - x_pad, today_num + x_pad
+    ax.set_xlim(x_left, x_right)
+    
+    # 历史净值（实线）、今日预估（虚线）与 MA60 参考线（点划线）合并为一个 LineCollection
+    n = len(xs)
+    segments = np.empty((n + 1, 2, 2))
+    segments[:n - 1, 0, 0], segments[:n - 1, 1, 0] = xs[:-1], xs[1:]
+    segments[:n - 1, 0, 1], segments[:n - 1, 1, 1] = navs[:-1], navs[1:]
+    segments[n - 1] = ((xs[-1], last_nav), (today_num, estimate_today))
+    segments[n] = ((x_left, ma_60), (x_right, ma_60))
+    
+    lines = artists.lines
+    lines.set_segments(segments)
+    lines.set_color(['#2c3e50'] * (n - 1) + [today_color, COLOR_MA60])
+    lines.set_linewidth([2] * n + [1.5])
+    lines.set_linestyle(['-'] * (n - 1) + [line_style, '-.'])
+    
+    # 数据点（历史 + 预估线段两端）
+    points = artists.points
+    points.set_offsets(np.column_stack((np.append(xs, (xs[-1], today_num)),
+                                        np.append(navs, (last_nav, estimate_today)))))
+    points.set_sizes([25] * n + [64, 64])
+    points.set_facecolor(['#2c3e50'] * n + [today_color, today_color])
+    points.set_edgecolor('face')
     
     # 标注今日预估值
-    ax.annotate(f'{estimate_today:.4f}',
-                xy=(today, estimate_today),
-                xytext=(10, 10),
-                textcoords='offset points',
-                fontsize=10,
-                color=today_color,
-                fontweight='bold')
-    
-    # 设置标题
+    value_text = artists.value_text
+    value_text.set_position((today_num, estimate_today))
+    value_text.set_text(f'{estimate_today:.4f}')
+    value_text.set_color(today_color)
+    
+    # 标题
     title = f'{fund_name} 走势图'
     if estimate_change is not None:
         title += f' | 今日{estimate_change:+.2f}%'
-    ax.set_title(title, fontsize=14, fontweight='bold', pad=15)
-    
-    # 设置坐标轴
-    ax.set_xlabel('日期', fontsize=10)
-    ax.set_ylabel('净值', fontsize=10)
+    ax.title.set_text(title)
     
-    # 日期格式
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=2))
-    plt.xticks(rotation=45)
-    
-    # 网格
-    ax.grid(True, linestyle='--', alpha=0.3, color=COLOR_GRID)
-    ax.set_axisbelow(True)
-    
-    # 图例
-    ax.legend(loc='upper left', fontsize=9)
+    # 图例：更新标签文字与今日预估句柄颜色
+    labels = [
+        '历史净值',
+        f'今日预估 ({estimate_change:+.2f}%)' if estimate_change else '今日预估',
+        f'MA60 ({ma_60:.4f})',
+    ]
+    for text, label in zip(artists.legend.get_texts(), labels):
+        text.set_text(label)
+    forecast = artists.legend.legend_handles[1]
+    forecast.set_color(today_color)
+    forecast.set_markerfacecolor(today_color)
+    forecast.set_markeredgecolor(today_color)
     
     # Y 轴范围留白
-    all_values = navs + [estimate_today, ma_60]
-    y_min, y_max = min(all_values), max(all_values)
+    y_min = min(float(navs.min()), estimate_today, ma_60)
+    y_max = max(float(navs.max()), estimate_today, ma_60)
     margin = (y_max - y_min) * 0.1
     ax.set_ylim(y_min - margin, y_max + margin)
     
-    # 调整布局
-    plt.tight_layout()
-    
-    # 输出为字节流
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    
-    plt.close(fig)
-    
-    logger.info(f"生成趋势图: {fund_name}")
-    return buf.getvalue()
+    return fig
 
 
 def generate_simple_chart(
@@ -192,8 +504,10 @@ def generate_simple_chart(
     Returns:
         PNG 图片字节流
     """
+    _lazy_mpl()
+    
     # 创建图表
-    fig, ax = plt.subplots(figsize=(8, 4), dpi=100)
+    fig, ax = _get_cached_axes((8, 4), 100, _SIMPLE_MARGINS)
     
     # X 轴为序号
     x = list(range(len(navs)))
@@ -210,14 +524,72 @@ def generate_simple_chart(
     # MA60
     ax.axhline(y=ma_60, color=COLOR_MA60, linestyle='-.', linewidth=1.5)
     
-    ax.set_title(f'{fund_name}', fontsize=12, fontweight='bold')
+    ax.set_title(f'{fund_name}', fontproperties=_cjk_font, fontsize=12, fontweight='bold')
     ax.grid(True, linestyle='--', alpha=0.3)
     
-    plt.tight_layout()
+    return _render_png(fig)
+
+
+def _physical_cores() -> int:
+    """
+    物理 CPU 核心数（超线程的逻辑核心不重复计数）
     
-    buf = io.BytesIO()
-    fig.savefig(buf, format='png', bbox_inches='tight', facecolor='white')
-    buf.seek(0)
-    plt.close(fig)
+    Linux 下按 /proc/cpuinfo 的 (physical id, core id) 去重，无法读取时回退到逻辑 CPU 数
+    """
+    try:
+        cores = set()
+        physical_id = "0"
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                key = key.strip()
+                if key == "physical id":
+                    physical_id = value.strip()
+                elif key == "core id":
+                    cores.add((physical_id, value.strip()))
+        if cores:
+            return len(cores)
+    except OSError:
+        pass
+    return os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """
+    获取批量渲染进程池单例（每个物理核心一个工作进程）
     
-    return buf.getvalue()
+    使用 spawn 启动工作进程：调用时进程内已有指标预热线程和调度线程，
+    fork 会复制其他线程持有的日志 / matplotlib 锁，可能导致工作进程死锁
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=_physical_cores(),
+                                        mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+
+def _render_one(args: tuple) -> bytes:
+    """进程池工作函数：按 generate_trend_chart 的参数顺序渲染单张趋势图"""
+    return generate_trend_chart(*args)
+
+
+def generate_trend_charts_batch(requests: list[tuple]) -> list[bytes]:
+    """
+    批量生成 "10+1" 趋势图，多张图表分发到进程池并行渲染
+    
+    matplotlib 绘图全程持有 GIL，多基金渲染使用多进程才能并行；
+    只有一张图表时直接在当前进程渲染，避免进程间通信开销。
+    工作进程以 spawn 方式启动，入口脚本需有 if __name__ == '__main__' 保护（main.py 已满足）
+    
+    Args:
+        requests: 每项为 generate_trend_chart 的位置参数元组
+            (fund_name, history_10d, estimate_today, ma_60[, estimate_change])
+    
+    Returns:
+        PNG 图片字节流列表，顺序与 requests 一致
+    """
+    if len(requests) <= 1:
+        return [generate_trend_chart(*args) for args in requests]
+    
+    return list(_get_pool().map(_render_one, requests, chunksize=4))
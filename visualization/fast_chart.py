@@ -0,0 +1,223 @@
+"""
+FundPilot-AI 轻量趋势图
+使用 Pillow ImageDraw 直接绘制 "10+1" 趋势图，不依赖 matplotlib
+
+图表只有十余条线段、一条均线和少量文字，直接按像素坐标绘制，
+省去 matplotlib 坐标变换、刻度定位、字体管理和图例布局的开销
+"""
+
+import functools
+import io
+from datetime import date
+from typing import Optional
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from core.logger import get_logger
+from visualization.chart import _CJK_FONT_PATHS
+
+logger = get_logger("fast_chart")
+
+# 画布尺寸与绘图区边距（像素），与 matplotlib 版 figsize=(10, 5), dpi=100 一致
+WIDTH, HEIGHT = 1000, 500
+MARGIN_LEFT, MARGIN_RIGHT = 80, 30
+MARGIN_TOP, MARGIN_BOTTOM = 60, 60
+
+# 颜色配置（与 visualization.chart 保持一致）
+COLOR_UP = '#e74c3c'       # 涨 - 红色
+COLOR_DOWN = '#27ae60'     # 跌 - 绿色
+COLOR_MA60 = '#3498db'     # MA60 - 蓝色
+COLOR_GRID = '#ecf0f1'     # 网格线
+COLOR_HISTORY = '#2c3e50'  # 历史净值
+COLOR_AXIS = '#7f8c8d'     # 坐标轴与刻度文字
+
+# Y 轴刻度数量
+Y_TICKS = 5
+
+
+@functools.cache
+def _load_fonts() -> Optional[tuple[ImageFont.FreeTypeFont, ImageFont.FreeTypeFont, ImageFont.FreeTypeFont]]:
+    """
+    首次绘图时加载中文字体，之后直接复用
+    
+    按 visualization.chart._CJK_FONT_PATHS 顺序取第一个可加载的 TrueType 字体；
+    Pillow 默认字体（低版本为位图字体）不支持 anchor 定位，也无法绘制中文，因此不作回退
+    
+    Returns:
+        (标题, 标注, 刻度) 字体，均不可用时返回 None
+    """
+    for font_path in _CJK_FONT_PATHS:
+        try:
+            return tuple(ImageFont.truetype(font_path, size) for size in (20, 13, 12))
+        except OSError:
+            continue
+    
+    logger.warning("未找到可用的中文 TrueType 字体，Pillow 趋势图不可用")
+    return None
+
+
+def fast_chart_available() -> bool:
+    """Pillow 趋势图是否可用（中文字体不可用时 visualization.chart 回退到 matplotlib）"""
+    return _load_fonts() is not None
+
+
+def _dashed_line(
+    draw: ImageDraw.ImageDraw,
+    start: tuple[float, float],
+    end: tuple[float, float],
+    fill: str,
+    width: int,
+    pattern: tuple[int, ...] = (8, 5)
+) -> None:
+    """
+    绘制虚线（ImageDraw 不支持线型，按线型模式逐段绘制）
+    
+    Args:
+        draw: 绘图对象
+        start: 起点像素坐标
+        end: 终点像素坐标
+        fill: 颜色
+        width: 线宽
+        pattern: 线型模式，交替为实线段与空白段长度（像素）
+    """
+    x0, y0 = start
+    length = float(np.hypot(end[0] - x0, end[1] - y0))
+    if length == 0:
+        return
+    
+    dx, dy = (end[0] - x0) / length, (end[1] - y0) / length
+    pos, i = 0.0, 0
+    while pos < length:
+        seg_end = min(pos + pattern[i % len(pattern)], length)
+        if i % 2 == 0:
+            draw.line([(x0 + dx * pos, y0 + dy * pos), (x0 + dx * seg_end, y0 + dy * seg_end)],
+                      fill=fill, width=width)
+        pos = seg_end
+        i += 1
+
+
+def _dot(draw: ImageDraw.ImageDraw, center: tuple[float, float], radius: float, fill: str) -> None:
+    """
+    绘制圆形数据点
+    
+    Args:
+        draw: 绘图对象
+        center: 圆心像素坐标
+        radius: 半径（像素）
+        fill: 颜色
+    """
+    x, y = center
+    draw.ellipse([x - radius, y - radius, x + radius, y + radius], fill=fill)
+
+
+def generate_trend_chart_fast(
+    fund_name: str,
+    history_10d: list[tuple[date, float]],
+    estimate_today: float,
+    ma_60: float,
+    estimate_change: Optional[float] = None
+) -> bytes:
+    """
+    生成 "10+1" 趋势图（Pillow 直接绘制）
+    
+    X 轴按交易日等距排列（今日预估位于最后一个位置），其余元素与 matplotlib 版一致
+    
+    Args:
+        fund_name: 基金名称
+        history_10d: 前 10 个交易日净值 [(日期, 净值), ...]（按日期升序）
+        estimate_today: 今日预估净值
+        ma_60: 60日均线
+        estimate_change: 预估涨跌幅
+    
+    Returns:
+        PNG 图片字节流（中文字体不可用时为空）
+    """
+    if not history_10d:
+        logger.warning("没有历史数据，无法生成图表")
+        return b""
+    
+    fonts = _load_fonts()
+    if fonts is None:
+        logger.warning("中文字体不可用，无法使用 Pillow 生成图表")
+        return b""
+    font_title, font_label, font_tick = fonts
+    
+    dates, navs = zip(*history_10d)
+    dates += (date.today(),)
+    values = np.fromiter(navs + (estimate_today,), dtype=np.float64, count=len(navs) + 1)
+    
+    today_color = COLOR_UP if estimate_today >= values[-2] else COLOR_DOWN
+    
+    # Y 轴范围留白（与 matplotlib 版一致：上下各留 10%）
+    y_min = min(float(values.min()), ma_60)
+    y_max = max(float(values.max()), ma_60)
+    margin = (y_max - y_min) * 0.1 or abs(y_max) * 0.01 or 1.0
+    y_min, y_max = y_min - margin, y_max + margin
+    
+    # 像素坐标
+    plot_h = HEIGHT - MARGIN_TOP - MARGIN_BOTTOM
+    x_pad = (WIDTH - MARGIN_LEFT - MARGIN_RIGHT) * 0.03
+    xs = np.linspace(MARGIN_LEFT + x_pad, WIDTH - MARGIN_RIGHT - x_pad, len(values))
+    ys = HEIGHT - MARGIN_BOTTOM - (values - y_min) / (y_max - y_min) * plot_h
+    ma_y = HEIGHT - MARGIN_BOTTOM - (ma_60 - y_min) / (y_max - y_min) * plot_h
+    points = list(zip(xs.tolist(), ys.tolist()))
+    
+    img = Image.new('RGB', (WIDTH, HEIGHT), 'white')
+    draw = ImageDraw.Draw(img)
+    
+    # 网格与 Y 轴刻度
+    for tick in np.linspace(y_min, y_max, Y_TICKS + 2)[1:-1]:
+        ty = HEIGHT - MARGIN_BOTTOM - (tick - y_min) / (y_max - y_min) * plot_h
+        draw.line([(MARGIN_LEFT, ty), (WIDTH - MARGIN_RIGHT, ty)], fill=COLOR_GRID, width=1)
+        draw.text((MARGIN_LEFT - 6, ty), f'{tick:.4f}', fill=COLOR_AXIS, font=font_tick, anchor='rm')
+    
+    # X 轴日期刻度
+    for (px, _), d in zip(points, dates):
+        draw.text((px, HEIGHT - MARGIN_BOTTOM + 8), d.strftime('%m-%d'),
+                  fill=COLOR_AXIS, font=font_tick, anchor='mt')
+    
+    # 绘图区边框
+    draw.rectangle([MARGIN_LEFT, MARGIN_TOP, WIDTH - MARGIN_RIGHT, HEIGHT - MARGIN_BOTTOM],
+                   outline=COLOR_AXIS, width=1)
+    
+    # MA60 参考线（点划线）
+    _dashed_line(draw, (MARGIN_LEFT, ma_y), (WIDTH - MARGIN_RIGHT, ma_y),
+                 COLOR_MA60, 2, pattern=(10, 4, 2, 4))
+    
+    # 历史净值（实线）
+    if len(points) > 2:
+        draw.line(points[:-1], fill=COLOR_HISTORY, width=3, joint='curve')
+    for p in points[:-1]:
+        _dot(draw, p, 3.5, COLOR_HISTORY)
+    
+    # 今日预估（虚线）
+    _dashed_line(draw, points[-2], points[-1], today_color, 2)
+    _dot(draw, points[-1], 5, today_color)
+    
+    # 标注今日预估值
+    draw.text((points[-1][0] - 8, points[-1][1] - 10), f'{estimate_today:.4f}',
+              fill=today_color, font=font_label, anchor='rb')
+    
+    # 图例
+    legend = [
+        (COLOR_HISTORY, '历史净值'),
+        (today_color, f'今日预估 ({estimate_change:+.2f}%)' if estimate_change else '今日预估'),
+        (COLOR_MA60, f'MA60 ({ma_60:.4f})'),
+    ]
+    for i, (color, label) in enumerate(legend):
+        ly = MARGIN_TOP + 14 + i * 20
+        draw.line([(MARGIN_LEFT + 10, ly), (MARGIN_LEFT + 34, ly)], fill=color, width=2)
+        draw.text((MARGIN_LEFT + 40, ly), label, fill=COLOR_HISTORY, font=font_label, anchor='lm')
+    
+    # 标题
+    title = f'{fund_name} 走势图'
+    if estimate_change is not None:
+        title += f' | 今日{estimate_change:+.2f}%'
+    draw.text((WIDTH / 2, MARGIN_TOP / 2), title, fill='black', font=font_title, anchor='mm')
+    
+    buf = io.BytesIO()
+    img.save(buf, format='PNG', compress_level=1)
+    
+    logger.info(f"生成趋势图: {fund_name}")
+    return buf.getvalue()